@@ -6,10 +6,47 @@ Build Script - Package Python project as executable files
 
 import os
 import sys
+import stat
 import shutil
+import hashlib
+import zipfile
 import subprocess
 from pathlib import Path
 import platform
+from importlib import metadata
+
+try:
+    from blake3 import blake3
+except ImportError:  # 未安装blake3时回退到hashlib.sha256
+    blake3 = None
+
+# 无法使用内核态复制时的复制缓冲区大小，减少系统调用次数
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Linux(sendfile)和macOS(fcopyfile)上shutil.copyfile在内核态复制文件数据
+KERNEL_COPY = sys.platform.startswith('linux') or sys.platform == 'darwin'
+
+# 构建缓存目录（位于项目目录之外，清理dist时不会被删除）
+BUILD_CACHE_DIR = Path("~/.cache/ai-transcriber-build").expanduser()
+
+# 已压缩格式，打包时直接存储，不再重复DEFLATE
+STORED_SUFFIXES = {'.exe', '.zip', '.gz', '.7z', '.pyz', '.dmg', '.png', '.jpg'}
+
+# PyInstaller规格文件，以及记录上次构建所用规格哈希的标记文件
+SPEC_FILE = "ai-transcriber-client.spec"
+SPEC_HASH_MARKER = Path("build") / ".spec-hash"
+
+# 参与构建哈希计算的文件
+BUILD_HASH_FILES = [
+    "main.py",
+    "downloader.py",
+    "uploader.py",
+    "config.py",
+    "unified_gui.py",
+    "run_gui.py",
+    "requirements.txt",
+    SPEC_FILE,
+]
 
 def colored_print(text: str, color: str = 'white'):
     """彩色输出"""
@@ -26,37 +63,44 @@ def colored_print(text: str, color: str = 'white'):
     print(f"{colors.get(color, colors['white'])}{text}{colors['reset']}")
 
 def run_command(cmd: str, description: str = "") -> bool:
-    """运行命令"""
+    """运行命令（实时输出，不在内存中缓存完整输出）"""
     if description:
         colored_print(f"🔧 {description}", 'blue')
     
     colored_print(f"   执行: {cmd}", 'cyan')
     
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-        if result.stdout:
-            print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
+        with subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+            returncode = proc.wait()
+    except OSError as e:
         colored_print(f"❌ 命令执行失败: {e}", 'red')
-        if e.stderr:
-            print(e.stderr)
         return False
+    
+    if returncode != 0:
+        colored_print(f"❌ 命令执行失败: 返回码 {returncode}", 'red')
+        return False
+    return True
 
 def install_build_dependencies():
     """安装构建依赖"""
     colored_print("📦 安装构建依赖...", 'yellow')
     
     dependencies = [
-        "pyinstaller",
+        "pyinstaller>=6.6",  # 6.6+ 支持Analysis(optimize=...)
         "auto-py-to-exe"
     ]
     
-    for dep in dependencies:
-        if not run_command(f"pip install {dep}", f"安装 {dep}"):
-            return False
-    
-    return True
+    # 一次性安装所有依赖，避免重复启动pip
+    pip_flags = "--disable-pip-version-check --no-input"
+    cmd = f"pip install {pip_flags} " + " ".join(f'"{dep}"' for dep in dependencies)
+    return run_command(cmd, "安装构建依赖")
+
+def is_release_build() -> bool:
+    """是否为发布构建（python build.py --release 或 BUILD_UPX=1）"""
+    return "--release" in sys.argv or os.environ.get("BUILD_UPX") == "1"
 
 def create_build_spec():
     """创建PyInstaller规格文件"""
@@ -65,6 +109,9 @@ def create_build_spec():
     # 检测操作系统
     system = platform.system().lower()
     
+    # UPX压缩耗时且拖慢启动，仅发布构建启用
+    use_upx = is_release_build()
+    
     spec_content = f"""# -*- mode: python ; coding: utf-8 -*-
 
 block_cipher = None
@@ -80,6 +127,7 @@ a = Analysis(
     hiddenimports=[
         'yt_dlp',
         'requests',
+        'requests_toolbelt',
         'tqdm',
         'colorama',
         'yaml',
@@ -94,6 +142,7 @@ a = Analysis(
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    optimize=2,
 )
 
 # 创建PYZ档案
@@ -111,7 +160,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx={use_upx},
     upx_exclude=[],
     runtime_tmpdir=None,
     console=True,
@@ -135,30 +184,157 @@ app = BUNDLE(
 '''}
 """
     
-    with open('ai-transcriber-client.spec', 'w', encoding='utf-8') as f:
-        f.write(spec_content)
+    # 内容未变化时不重写，保留PyInstaller的增量构建缓存
+    spec_path = Path(SPEC_FILE)
+    if spec_path.exists() and spec_path.read_text(encoding='utf-8') == spec_content:
+        colored_print("✅ 规格文件无变化，跳过写入", 'green')
+        return True
+    
+    spec_path.write_text(spec_content, encoding='utf-8')
     
     colored_print("✅ 规格文件创建完成", 'green')
     return True
 
+def _new_hasher():
+    """创建构建哈希对象（优先使用多线程BLAKE3）"""
+    if blake3 is not None:
+        return blake3(max_threads=blake3.AUTO)
+    return hashlib.sha256()
+
+def _hash_file(path) -> str:
+    """分块计算文件哈希（BLAKE3不可用时为SHA-256）"""
+    with open(path, 'rb') as f:
+        if blake3 is None and hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        h = _new_hasher()
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+        return h.hexdigest()
+
+def _compute_build_hash() -> str:
+    """计算源文件、规格文件、Python及已安装依赖版本的构建哈希"""
+    h = _new_hasher()
+    for file_name in BUILD_HASH_FILES:
+        h.update(file_name.encode('utf-8'))
+        if os.path.exists(file_name):
+            h.update(_hash_file(file_name).encode('ascii'))
+    h.update(sys.version.encode('utf-8'))
+    # 打包结果取决于环境中安装了哪些包（含可选依赖），任何包的安装、升级或卸载都会使缓存失效
+    packages = sorted(
+        f"{(dist.metadata['Name'] or '').lower()}=={dist.version}"
+        for dist in metadata.distributions()
+    )
+    h.update("\n".join(packages).encode('utf-8'))
+    return h.hexdigest()
+
 def build_executable():
     """构建可执行文件"""
     colored_print("🏗️ 开始构建可执行文件...", 'yellow')
     
+    # 规格文件与上次构建一致时保留build目录，支持增量构建
+    spec_hash = _hash_file(SPEC_FILE)
+    incremental = SPEC_HASH_MARKER.exists() and SPEC_HASH_MARKER.read_text() == spec_hash
+    
     # 清理旧的构建文件
-    for dir_name in ['build', 'dist']:
+    for dir_name in ['dist'] if incremental else ['build', 'dist']:
         if os.path.exists(dir_name):
             shutil.rmtree(dir_name)
             colored_print(f"🧹 清理旧的{dir_name}目录", 'cyan')
     
+    # 检查构建缓存
+    build_hash = _compute_build_hash()
+    cached_dist = BUILD_CACHE_DIR / build_hash / "dist"
+    if cached_dist.exists():
+        fast_copytree(cached_dist, "dist")
+        colored_print(f"♻️ 命中构建缓存: {cached_dist}", 'cyan')
+        colored_print("✅ 可执行文件构建完成!", 'green')
+        return True
+    
     # 运行PyInstaller
-    cmd = "pyinstaller --clean ai-transcriber-client.spec"
+    cmd = f"pyinstaller {SPEC_FILE}" if incremental else f"pyinstaller --clean {SPEC_FILE}"
     if not run_command(cmd, "运行PyInstaller构建"):
         return False
+    SPEC_HASH_MARKER.write_text(spec_hash)
+    
+    # 移除残留的字节码缓存目录
+    for pycache in list(Path("dist").rglob("__pycache__")):
+        shutil.rmtree(pycache, ignore_errors=True)
+    
+    # 保存构建缓存（先复制到临时目录再重命名，复制中断时不会留下不完整的缓存）
+    tmp_dist = cached_dist.with_name(f"dist.tmp-{os.getpid()}")
+    try:
+        fast_copytree("dist", tmp_dist)
+        os.replace(tmp_dist, cached_dist)
+        colored_print(f"💾 构建结果已缓存: {cached_dist}", 'cyan')
+    except OSError as e:
+        shutil.rmtree(tmp_dist, ignore_errors=True)
+        colored_print(f"⚠️ 保存构建缓存失败: {e}", 'yellow')
     
     colored_print("✅ 可执行文件构建完成!", 'green')
     return True
 
+def iter_files(root: str):
+    """使用os.scandir递归遍历文件，复用DirEntry缓存的类型信息"""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+def copy_entry(entry: os.DirEntry, dst):
+    """复制单个文件，复用DirEntry缓存的stat结果设置权限和时间戳"""
+    st = entry.stat()
+    if KERNEL_COPY:
+        shutil.copyfile(entry.path, dst)
+    else:
+        with open(entry.path, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst, length=COPY_BUFFER_SIZE)
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+def fast_copytree(src, dst):
+    """基于os.scandir的目录复制，减少重复的stat系统调用"""
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        for entry in it:
+            dst_path = os.path.join(dst, entry.name)
+            if entry.is_symlink():
+                os.symlink(os.readlink(entry.path), dst_path)
+            elif entry.is_dir(follow_symlinks=False):
+                fast_copytree(entry.path, dst_path)
+            else:
+                copy_entry(entry, dst_path)
+
+def _make_zip(archive_path: str, root_dir):
+    """创建ZIP压缩包，已压缩的二进制文件直接存储"""
+    root_dir = os.fspath(root_dir)
+    with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
+        for entry in iter_files(root_dir):
+            arcname = os.path.relpath(entry.path, root_dir)
+            suffix = os.path.splitext(entry.name)[1].lower()
+            compress_type = zipfile.ZIP_STORED if suffix in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+            zipf.write(entry.path, arcname, compress_type=compress_type)
+
+def _make_tar_gz(archive_path: str, release_dir: Path):
+    """创建tar.gz压缩包，系统中有tar和pigz时使用多核并行压缩"""
+    pigz = shutil.which("pigz")
+    tar_cmd = shutil.which("tar")
+    if pigz and tar_cmd:
+        try:
+            with open(archive_path, 'wb') as out:
+                tar = subprocess.Popen([tar_cmd, "-C", str(release_dir), "-cf", "-", "."],
+                                       stdout=subprocess.PIPE)
+                gz = subprocess.run([pigz, "-p", str(os.cpu_count() or 1)], stdin=tar.stdout, stdout=out)
+                tar.stdout.close()
+                if tar.wait() == 0 and gz.returncode == 0:
+                    return
+        except OSError as e:
+            colored_print(f"⚠️ 无法运行tar/pigz: {e}", 'yellow')
+        colored_print("⚠️ pigz压缩失败，回退到标准压缩", 'yellow')
+    
+    shutil.make_archive(archive_path[:-len(".tar.gz")], 'gztar', release_dir)
+
 def create_distribution():
     """创建发布包"""
     colored_print("📦 创建发布包...", 'yellow')
@@ -194,23 +370,24 @@ def create_distribution():
     
     # 复制可执行文件
     dist_dir = Path("dist")
+    dist_entries = {e.name: e for e in os.scandir(dist_dir)} if dist_dir.exists() else {}
     if system == "darwin":
         # macOS应用包
-        app_bundle = dist_dir / "AI-Transcriber-Client.app"
-        if app_bundle.exists():
-            shutil.copytree(app_bundle, release_dir / "AI-Transcriber-Client.app")
+        app_name = "AI-Transcriber-Client.app"
+        if app_name in dist_entries:
+            fast_copytree(dist_entries[app_name].path, release_dir / app_name)
     else:
         # Windows/Linux可执行文件
         exe_name = "ai-transcriber-client.exe" if system == "windows" else "ai-transcriber-client"
-        exe_path = dist_dir / exe_name
-        if exe_path.exists():
-            shutil.copy2(exe_path, release_dir / exe_name)
+        if exe_name in dist_entries:
+            copy_entry(dist_entries[exe_name], release_dir / exe_name)
     
     # 复制文档
     docs = ['README.md', 'requirements.txt']
+    root_entries = {e.name: e for e in os.scandir('.')}
     for doc in docs:
-        if os.path.exists(doc):
-            shutil.copy2(doc, release_dir / doc)
+        if doc in root_entries:
+            copy_entry(root_entries[doc], release_dir / doc)
     
     # 创建启动脚本 (Linux/macOS)
     if system != "windows":
@@ -238,10 +415,10 @@ pause
     # 创建压缩包
     if system == "windows":
         archive_name = f"{release_name}.zip"
-        shutil.make_archive(f"releases/{release_name}", 'zip', release_dir)
+        _make_zip(f"releases/{archive_name}", release_dir)
     else:
         archive_name = f"{release_name}.tar.gz"
-        shutil.make_archive(f"releases/{release_name}", 'gztar', release_dir)
+        _make_tar_gz(f"releases/{archive_name}", release_dir)
     
     colored_print(f"✅ 发布包创建完成: releases/{archive_name}", 'green')
     return True
@@ -252,13 +429,15 @@ def show_build_info():
     colored_print(f"   操作系统: {platform.system()}", 'white')
     colored_print(f"   架构: {platform.machine()}", 'white')
     colored_print(f"   Python版本: {sys.version}", 'white')
+    colored_print(f"   构建类型: {'发布 (UPX)' if is_release_build() else '开发'}", 'white')
     
     # 检查可执行文件
     dist_dir = Path("dist")
     if dist_dir.exists():
         colored_print(f"   输出目录: {dist_dir.absolute()}", 'white')
         
-        files = list(dist_dir.iterdir())
+        with os.scandir(dist_dir) as it:
+            files = list(it)
         if files:
             colored_print("   生成的文件:", 'white')
             for file in files:
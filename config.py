@@ -6,11 +6,27 @@ Configuration Management Module
 
 import os
 import json
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
+# JSON解析支持（优先使用orjson）
+try:
+    import orjson
+    
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 @dataclass
 class ClientConfig:
     """客户端配置类"""
@@ -30,6 +46,8 @@ class ClientConfig:
     chunk_size: int = 8 * 1024 * 1024  # 8MB chunks
     max_retries: int = 3
     timeout: int = 300  # 5分钟超时
+    compress_upload: bool = False  # 以zstd压缩上传WAV/AIFF音频，需服务器支持Content-Encoding: zstd
+    large_upload_tuning: bool = False  # 增大TCP发送缓冲区(4MB)，适合高延迟高带宽链路上传大文件
     
     # 用户界面配置
     show_progress: bool = True
@@ -38,7 +56,10 @@ class ClientConfig:
     
     # 高级配置
     concurrent_downloads: int = 1
-    temp_dir: Optional[str] = None
+    fragment_workers: int = 4  # HLS/DASH分片并发下载数
+    temp_dir: Optional[str] = None  # 下载中间目录，应与download_dir位于同一文件系统
+    cache_dir: Optional[str] = None  # 默认为 ~/.ai-transcriber/cache
+    info_cache_ttl: int = 1800  # 视频信息缓存有效期（秒），0表示禁用
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -58,45 +79,59 @@ class ConfigManager:
         初始化配置管理器
         
         Args:
-            config_path: 配置文件路径，默认为用户目录下的.ai-transcriber
+            config_path: 配置文件路径，默认为用户目录下的.ai-transcriber/config.json
         """
+        legacy_path = None
         if config_path:
             self.config_path = Path(config_path)
         else:
             # 默认配置目录
             home = Path.home()
-            self.config_path = home / ".ai-transcriber" / "config.yaml"
+            self.config_path = home / ".ai-transcriber" / "config.json"
+            legacy_path = home / ".ai-transcriber" / "config.yaml"
         
         self.config_path.parent.mkdir(exist_ok=True, parents=True)
         self.config = ClientConfig()
         
-        # 加载现有配置
-        self.load_config()
+        # 加载现有配置（旧版YAML配置自动迁移为JSON）
+        if legacy_path and not self.config_path.exists() and legacy_path.exists():
+            if self._load_file(legacy_path):
+                self.save_config()
+        else:
+            self.load_config()
+    
+    def _load_file(self, path: Path) -> bool:
+        """从指定文件加载配置"""
+        try:
+            if path.suffix.lower() == '.json':
+                data = _json_loads(path.read_bytes())
+            else:
+                import yaml  # 仅在使用YAML配置时导入
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = yaml.safe_load(f) or {}
+            
+            self.config = ClientConfig.from_dict(data)
+            print(f"✅ 配置加载成功: {path}")
+            return True
+            
+        except Exception as e:
+            print(f"⚠️ 配置文件加载失败: {e}")
+            print("使用默认配置")
+            return False
     
     def load_config(self):
         """加载配置文件"""
         if self.config_path.exists():
-            try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    if self.config_path.suffix.lower() == '.json':
-                        data = json.load(f)
-                    else:
-                        data = yaml.safe_load(f) or {}
-                    
-                    self.config = ClientConfig.from_dict(data)
-                    print(f"✅ 配置加载成功: {self.config_path}")
-                    
-            except Exception as e:
-                print(f"⚠️ 配置文件加载失败: {e}")
-                print("使用默认配置")
+            self._load_file(self.config_path)
     
     def save_config(self):
         """保存配置文件"""
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                if self.config_path.suffix.lower() == '.json':
-                    json.dump(self.config.to_dict(), f, indent=2, ensure_ascii=False)
-                else:
+            if self.config_path.suffix.lower() == '.json':
+                self.config_path.write_bytes(_json_dumps(self.config.to_dict()))
+            else:
+                import yaml  # 仅在使用YAML配置时导入
+                with open(self.config_path, 'w', encoding='utf-8') as f:
                     yaml.safe_dump(self.config.to_dict(), f, 
                                  default_flow_style=False, allow_unicode=True)
             
@@ -9,6 +9,9 @@ import shutil
 import zipfile
 from pathlib import Path
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+from build import copy_entry, iter_files
 
 def create_release_package():
     """创建发布包"""
@@ -48,14 +51,21 @@ def create_release_package():
         print("📂 复制文件...")
         
         # 复制文件到临时目录
+        source_entries = {e.name: e for e in os.scandir(source_dir)}
+        pairs = []
         for file_name in files_to_include:
-            source_file = source_dir / file_name
-            if source_file.exists():
-                shutil.copy2(source_file, temp_dir / file_name)
-                print(f"✅ 复制: {file_name}")
+            if file_name in source_entries:
+                pairs.append((source_entries[file_name], temp_dir / file_name))
             else:
                 print(f"⚠️ 跳过: {file_name} (不存在)")
         
+        # 文件复制为I/O密集型操作，使用线程池并行执行
+        if pairs:
+            with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as executor:
+                list(executor.map(lambda pair: copy_entry(*pair), pairs))
+            for entry, _ in pairs:
+                print(f"✅ 复制: {entry.name}")
+        
         # 创建安装说明
         install_instructions = """# AI转录器本地客户端 v1.0.0
 
@@ -143,12 +153,11 @@ pause
         print("📦 创建ZIP文件...")
         
         # 创建ZIP文件
-        with zipfile.ZipFile(package_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_path = Path(root) / file
-                    arcname = file_path.relative_to(temp_dir)
-                    zipf.write(file_path, arcname)
+        # 源码包以文本为主且体积小，使用最高DEFLATE压缩级别
+        # （LZMA/BZIP2压缩的ZIP无法用Windows资源管理器直接解压）
+        with zipfile.ZipFile(package_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zipf:
+            for entry in iter_files(str(temp_dir)):
+                zipf.write(entry.path, os.path.relpath(entry.path, temp_dir))
         
         # 清理临时目录
         shutil.rmtree(temp_dir)
@@ -160,7 +169,8 @@ pause
         latest_path = release_dir / "ai-transcriber-client-latest.zip"
         if latest_path.exists():
             latest_path.unlink()
-        shutil.copy2(package_path, latest_path)
+        shutil.copyfile(package_path, latest_path)
+        shutil.copystat(package_path, latest_path)
         print(f"🔗 最新版本链接: {latest_path}")
         
         return str(latest_path)
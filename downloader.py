@@ -5,20 +5,78 @@ Audio Downloader Module
 """
 
 import os
+import errno
 import sys
+import json
+import sqlite3
 import subprocess
 import tempfile
 import shutil
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, TYPE_CHECKING
 from dataclasses import dataclass
+from contextlib import closing
 import hashlib
 import time
+import atexit
+import functools
+import itertools
+import threading
+import weakref
 
-import yt_dlp
-from tqdm import tqdm
+from config import get_config, ClientConfig
+
+# yt-dlp导入时会加载数百个提取器模块，延迟到实际下载时再导入
+if TYPE_CHECKING:
+    import yt_dlp
+
+@functools.lru_cache(maxsize=1)
+def _supported_sites() -> tuple:
+    """枚举yt-dlp提取器类（无需创建YoutubeDL实例，结果缓存）"""
+    from yt_dlp.extractor import gen_extractor_classes
+    
+    return tuple(ie.IE_NAME for ie in gen_extractor_classes()[:50])  # 前50个
+
+
+def _freeze(value: Any) -> Any:
+    """将选项转换为可哈希的形式，用作缓存键"""
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# 音频和视频下载共用的yt-dlp选项 (反检测措施)
+_BASE_YT_DLP_OPTS: Dict[str, Any] = {
+    'force_ipv4': True,  # 强制使用IPv4
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'referer': 'https://www.youtube.com/',
+    'headers': {
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Sec-Fetch-User': '?1',
+    },
+    'extractor_args': {
+        'youtube': {
+            'player_client': ['android', 'web'],
+        }
+    },
+    'cachedir': False,  # 禁用缓存
+}
+
+# 提取视频信息使用的选项：与下载共用同一套客户端配置，提取出的格式及其请求头可直接用于下载
+_INFO_YT_DLP_OPTS: Dict[str, Any] = {
+    **_BASE_YT_DLP_OPTS,
+    'quiet': True,
+    'no_warnings': True,
+    'skip_download': True,
+}
+_INFO_OPTS_DIGEST = hashlib.sha256(json.dumps(_INFO_YT_DLP_OPTS, sort_keys=True).encode('utf-8')).hexdigest()[:16]
 
-from config import get_config
 
 @dataclass
 class DownloadResult:
@@ -33,29 +91,190 @@ class DownloadResult:
     metadata: Optional[Dict[str, Any]] = None
 
 
+class VideoInfoCache:
+    """视频信息磁盘缓存（SQLite），避免重复提取同一URL的信息"""
+    
+    def __init__(self, db_path: Path, ttl: int, namespace: str = ''):
+        """
+        初始化缓存
+        
+        Args:
+            db_path: SQLite数据库路径
+            ttl: 缓存有效期（秒）
+            namespace: 缓存键前缀，提取选项变化时旧条目自动失效
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.namespace = namespace
+        self.db_path.parent.mkdir(exist_ok=True, parents=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS video_info ("
+                "url_hash TEXT PRIMARY KEY, fetched_at REAL NOT NULL, info_json TEXT NOT NULL)"
+            )
+    
+    def _connect(self) -> sqlite3.Connection:
+        """打开数据库连接（每次调用单独连接，可在多线程中使用）"""
+        return sqlite3.connect(str(self.db_path), timeout=5)
+    
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(f"{self.namespace}\n{url}".encode('utf-8')).hexdigest()
+    
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """获取未过期的缓存信息"""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT info_json FROM video_info WHERE url_hash = ? AND fetched_at > ?",
+                    (self._key(url), time.time() - self.ttl)
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError):
+            return None
+    
+    def put(self, url: str, info: Dict[str, Any]):
+        """写入缓存信息"""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO video_info (url_hash, fetched_at, info_json) VALUES (?, ?, ?)",
+                    (self._key(url), time.time(), json.dumps(info, ensure_ascii=False))
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"⚠️ 写入视频信息缓存失败: {e}")
+
+
+# 存活的下载器实例（弱引用，不会阻止实例被回收），退出时统一关闭
+_live_downloaders: 'weakref.WeakSet[AudioDownloader]' = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_downloaders():
+    """进程退出时关闭仍存活的下载器"""
+    for downloader in list(_live_downloaders):
+        downloader.close()
+
+
 class AudioDownloader:
     """音频下载器"""
     
+    # 文件名中不安全字符的替换表
+    _UNSAFE_TBL = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+    
+    # 下载进度转发给回调的最小间隔（秒），即最高10Hz
+    _PROGRESS_INTERVAL = 0.1
+    
     def __init__(self):
         """初始化下载器"""
-        self.config = get_config()
-        self.download_dir = Path(self.config.download_dir)
+        # 进度回调函数
+        self.progress_callback: Optional[Callable] = None
+        
+        # 最新下载进度（由yt-dlp钩子写入，后台线程定期合并转发）
+        self._progress_state: Optional[Dict[str, Any]] = None
+        self._progress_lock = threading.Lock()
+        self._progress_emit_lock = threading.Lock()
+        self._progress_stop = threading.Event()
+        self._progress_thread: Optional[threading.Thread] = None
+        
+        # 文件名后缀：启动时间 + 递增序号，并发下载时不会重名
+        self._start_time = int(time.time())
+        self._counter = itertools.count()
+        
+        # YoutubeDL实例缓存（按线程和选项复用，避免重复初始化提取器）
+        self._ydl_cache: Dict[Any, 'yt_dlp.YoutubeDL'] = {}
+        self._ydl_lock = threading.Lock()
+        _live_downloaders.add(self)
+        
+        # 视频信息缓存
+        self._info_cache: Optional[VideoInfoCache] = None
+        
+        self.update_config(get_config())
+        
+        print(f"📂 下载目录: {self.download_dir}")
+    
+    def update_config(self, config: ClientConfig):
+        """
+        应用新配置（保留已缓存的YoutubeDL实例和进度转发线程）
+        
+        Args:
+            config: 新的客户端配置
+        """
+        self.config = config
+        self.download_dir = Path(config.download_dir)
         self.download_dir.mkdir(exist_ok=True, parents=True)
         
         # 临时目录
-        self.temp_dir = Path(self.config.temp_dir) if self.config.temp_dir else None
+        self.temp_dir = Path(config.temp_dir) if config.temp_dir else None
         
-        # 进度回调函数
-        self.progress_callback: Optional[Callable] = None
+        # 视频信息缓存（数据库路径或有效期变化时才重新打开）
+        cache_dir = Path(config.cache_dir) if config.cache_dir else Path.home() / ".ai-transcriber" / "cache"
+        db_path = cache_dir / "info.sqlite"
+        if config.info_cache_ttl <= 0:
+            self._info_cache = None
+        elif (self._info_cache is None or self._info_cache.db_path != db_path
+              or self._info_cache.ttl != config.info_cache_ttl):
+            try:
+                self._info_cache = VideoInfoCache(db_path, config.info_cache_ttl, _INFO_OPTS_DIGEST)
+            except sqlite3.Error as e:
+                self._info_cache = None
+                print(f"⚠️ 视频信息缓存不可用: {e}")
         
-        print(f"📂 下载目录: {self.download_dir}")
+        # 预先构建的yt-dlp基础选项，每次下载只需合并输出路径
+        self._base_options = self._build_base_options()
+    
+    def _get_ydl(self, options: Dict[str, Any]) -> 'yt_dlp.YoutubeDL':
+        """获取（或创建）指定选项对应的YoutubeDL实例"""
+        import yt_dlp
+        
+        # YoutubeDL实例不是线程安全的，每个线程使用各自的实例
+        key = (threading.get_ident(), _freeze(options))
+        with self._ydl_lock:
+            ydl = self._ydl_cache.get(key)
+            if ydl is None:
+                ydl = self._ydl_cache[key] = yt_dlp.YoutubeDL(options)
+        return ydl
+    
+    def close(self):
+        """关闭缓存的YoutubeDL实例并停止进度转发线程"""
+        self._progress_stop.set()
+        with self._ydl_lock:
+            for ydl in self._ydl_cache.values():
+                try:
+                    ydl.close()
+                except Exception:
+                    pass
+            self._ydl_cache.clear()
     
     def set_progress_callback(self, callback: Callable):
         """设置进度回调函数"""
         self.progress_callback = callback
+        self._base_options = self._build_base_options()
+        if callback and self._progress_thread is None:
+            self._progress_thread = threading.Thread(
+                target=self._progress_flush_loop, name="progress-flusher", daemon=True
+            )
+            self._progress_thread.start()
     
-    def _get_yt_dlp_options(self, output_path: str) -> Dict[str, Any]:
-        """获取yt-dlp配置选项"""
+    def _common_yt_dlp_options(self) -> Dict[str, Any]:
+        """音频和视频下载共用的yt-dlp选项（反检测措施、输出控制、分片并发和进度钩子）"""
+        options = {
+            **_BASE_YT_DLP_OPTS,
+            'no_warnings': not self.config.verbose,
+            'quiet': not self.config.verbose,
+            'no_color': not self.config.use_colors,
+            
+            # 分片格式(HLS/DASH)并发下载分片
+            'concurrent_fragment_downloads': getattr(self.config, 'fragment_workers', 4),
+        }
+        
+        # 添加进度钩子
+        if self.progress_callback:
+            options['progress_hooks'] = [self._progress_hook]
+        
+        return options
+    
+    def _build_base_options(self) -> Dict[str, Any]:
+        """根据当前配置预先构建yt-dlp音频下载基础选项（不含输出路径）"""
         
         # 质量映射
         quality_map = {
@@ -66,110 +285,117 @@ class AudioDownloader:
         
         # 基础选项 (增强反检测)
         audio_format = getattr(self.config, 'audio_format', 'mp3')
-        options = {
+        return {
+            **self._common_yt_dlp_options(),
             'format': quality_map.get(self.config.audio_quality, "bestaudio/best"),
-            'outtmpl': f"{str(output_path)}.%(ext)s",
             'postprocessors': [{
                 'key': 'FFmpegExtractAudio',
                 'preferredcodec': audio_format,
                 'preferredquality': '0' if self.config.audio_quality == 'best' else '5',
             }],
-            'no_warnings': not self.config.verbose,
-            'quiet': not self.config.verbose,
-            'no_color': not self.config.use_colors,
-            
-            # 反检测措施
-            'force_ipv4': True,  # 强制使用IPv4
-            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'referer': 'https://www.youtube.com/',
-            'headers': {
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-            },
-            'extractor_args': {
-                'youtube': {
-                    'player_client': ['android', 'web'],
-                    'skip': ['dash', 'hls'],
-                }
-            },
-            'cachedir': False,  # 禁用缓存
         }
-        
-        # 添加进度钩子
-        if self.progress_callback:
-            options['progress_hooks'] = [self._progress_hook]
-        
-        # 临时目录
+    
+    def _get_yt_dlp_options(self, output_path: str) -> Dict[str, Any]:
+        """获取yt-dlp配置选项"""
         if self.temp_dir:
             self.temp_dir.mkdir(exist_ok=True, parents=True)
-            options['temp_dir'] = str(self.temp_dir)
-        
-        return options
+        return {**self._base_options, 'outtmpl': f"{output_path}.%(ext)s"}
+    
+    def _move_to_download_dir(self, path: Path) -> Path:
+        """将临时目录中下载完成的文件移动到下载目录（同一文件系统上为原子重命名）"""
+        if not self.temp_dir or path.parent == self.download_dir:
+            return path
+        final_path = self.download_dir / path.name
+        try:
+            os.replace(path, final_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # 临时目录与下载目录不在同一文件系统，回退到复制
+            shutil.move(str(path), str(final_path))
+        return final_path
     
     def _progress_hook(self, d: Dict[str, Any]):
-        """yt-dlp进度回调"""
+        """yt-dlp进度回调（仅记录最新状态，由后台线程合并转发）"""
         if d['status'] == 'downloading':
-            if 'total_bytes' in d:
-                percent = d.get('downloaded_bytes', 0) / d['total_bytes'] * 100
-                speed = d.get('speed', 0)
-                eta = d.get('eta', 0)
-                
+            with self._progress_lock:
+                self._progress_state = d
+        
+        elif d['status'] == 'finished':
+            with self._progress_emit_lock:
+                # 丢弃尚未转发的进度，保证finished是该文件的最后一条消息
+                with self._progress_lock:
+                    self._progress_state = None
                 if self.progress_callback:
+                    self.progress_callback({
+                        'status': 'finished',
+                        'filename': d.get('filename')
+                    })
+    
+    def _progress_flush_loop(self):
+        """后台线程：每隔_PROGRESS_INTERVAL转发一次最新下载进度"""
+        while not self._progress_stop.wait(self._PROGRESS_INTERVAL):
+            with self._progress_emit_lock:
+                with self._progress_lock:
+                    d, self._progress_state = self._progress_state, None
+                
+                if d is None or 'total_bytes' not in d or not self.progress_callback:
+                    continue
+                
+                try:
                     self.progress_callback({
                         'status': 'downloading',
-                        'percent': percent,
-                        'speed': speed,
-                        'eta': eta
+                        'percent': d.get('downloaded_bytes', 0) / d['total_bytes'] * 100,
+                        'speed': d.get('speed', 0),
+                        'eta': d.get('eta', 0)
                     })
-        
-        elif d['status'] == 'finished':
-            if self.progress_callback:
-                self.progress_callback({
-                    'status': 'finished',
-                    'filename': d.get('filename')
-                })
+                except Exception as e:
+                    print(f"⚠️ 进度回调失败: {e}")
     
     def _sanitize_filename(self, filename: str) -> str:
         """清理文件名"""
         # 移除或替换不安全的字符
-        unsafe_chars = '<>:"/\\|?*'
-        for char in unsafe_chars:
-            filename = filename.replace(char, '_')
-        
-        # 限制长度
-        if len(filename) > 200:
-            filename = filename[:200]
+        filename = filename.translate(self._UNSAFE_TBL)
         
-        return filename
+        # 按UTF-8字节数限制长度，避免截断多字节字符
+        return filename.encode('utf-8')[:200].decode('utf-8', errors='ignore')
+    
+    def _get_downloaded_path(self, info: Optional[Dict[str, Any]]) -> Optional[Path]:
+        """从yt-dlp返回的信息中获取实际输出文件路径"""
+        if not info:
+            return None
+        downloads = info.get('requested_downloads') or []
+        filepath = downloads[0].get('filepath') if downloads else None
+        filepath = filepath or info.get('filepath') or info.get('_filename')
+        return Path(filepath) if filepath else None
     
     def get_video_info(self, url: str) -> Optional[Dict[str, Any]]:
-        """获取视频信息"""
+        """获取视频信息（优先使用磁盘缓存）"""
+        if self._info_cache:
+            cached = self._info_cache.get(url)
+            if cached:
+                return cached
+        
         try:
-            options = {
-                'quiet': True,
-                'no_warnings': True,
-                'skip_download': True
-            }
-            
-            with yt_dlp.YoutubeDL(options) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return info
+            ydl = self._get_ydl(_INFO_YT_DLP_OPTS)
+            info = ydl.extract_info(url, download=False)
+            if info and self._info_cache:
+                self._info_cache.put(url, ydl.sanitize_info(info))
+            return info
                 
         except Exception as e:
             print(f"❌ 获取视频信息失败: {e}")
             return None
     
-    def download_audio(self, url: str, custom_filename: Optional[str] = None) -> DownloadResult:
+    def download_audio(self, url: str, custom_filename: Optional[str] = None,
+                       info: Optional[Dict[str, Any]] = None) -> DownloadResult:
         """
         下载音频文件
         
         Args:
             url: 视频URL
             custom_filename: 自定义文件名
+            info: 已获取的视频信息（可选，避免重复提取）
         
         Returns:
             DownloadResult: 下载结果
@@ -177,8 +403,11 @@ class AudioDownloader:
         print(f"🎬 开始处理: {url}")
         
         try:
+            import yt_dlp
+            
             # 获取视频信息
-            info = self.get_video_info(url)
+            if info is None:
+                info = self.get_video_info(url)
             if not info:
                 return DownloadResult(
                     success=False,
@@ -206,36 +435,35 @@ class AudioDownloader:
                 filename = custom_filename
             else:
                 safe_title = self._sanitize_filename(title)
-                timestamp = int(time.time())
-                filename = f"{safe_title}_{timestamp}"
+                filename = f"{safe_title}_{self._start_time}_{next(self._counter)}"
             
             # 输出路径（不带扩展名，yt-dlp会自动添加）
-            output_path = self.download_dir / filename
+            # 配置了临时目录时先下载到临时目录，完成后再移动到下载目录
+            output_path = (self.temp_dir or self.download_dir) / filename
             
             # yt-dlp选项
             options = self._get_yt_dlp_options(str(output_path))
             
             print(f"📥 开始下载...")
             
-            # 下载
+            # 下载（复用已提取的视频信息，避免重复提取）
             with yt_dlp.YoutubeDL(options) as ydl:
-                ydl.download([url])
-            
-            # 查找下载的文件 (优先查找指定音频格式)
-            audio_file = self.download_dir / f"{filename}.{audio_format}"
-            if audio_file.exists():
-                downloaded_file = audio_file
-            else:
-                # 查找任何匹配的文件
-                downloaded_files = list(self.download_dir.glob(f"{filename}*"))
-                if not downloaded_files:
-                    return DownloadResult(
-                        success=False,
-                        error_message="下载完成但找不到文件"
-                    )
-                downloaded_file = downloaded_files[0]
+                info = ydl.process_ie_result(info, download=True)
+                
+                # 获取下载的文件 (优先使用yt-dlp返回的实际路径，音频提取后扩展名会改变)
+                downloaded_file = self._get_downloaded_path(info)
+                if downloaded_file is None:
+                    audio_format = getattr(self.config, 'audio_format', 'mp3')
+                    downloaded_file = Path(ydl.prepare_filename(info)).with_suffix(f".{audio_format}")
             
-            file_size = downloaded_file.stat().st_size
+            try:
+                downloaded_file = self._move_to_download_dir(downloaded_file)
+                file_size = downloaded_file.stat().st_size
+            except OSError:
+                return DownloadResult(
+                    success=False,
+                    error_message="下载完成但找不到文件"
+                )
             
             print(f"✅ 音频下载完成: {downloaded_file.name}")
             print(f"📊 文件大小: {file_size / 1024 / 1024:.1f}MB")
@@ -264,20 +492,25 @@ class AudioDownloader:
                 error_message=error_msg
             )
     
-    def download_video(self, url: str, custom_filename: Optional[str] = None) -> DownloadResult:
+    def download_video(self, url: str, custom_filename: Optional[str] = None,
+                       info: Optional[Dict[str, Any]] = None) -> DownloadResult:
         """
         下载视频文件（包含视频和音频）
         
         Args:
             url: 视频URL
             custom_filename: 自定义文件名（可选）
+            info: 已获取的视频信息（可选，避免重复提取）
             
         Returns:
             DownloadResult: 下载结果
         """
         try:
-            print(f"🔍 获取视频信息...")
-            info = self.get_video_info(url)
+            import yt_dlp
+            
+            if info is None:
+                print(f"🔍 获取视频信息...")
+                info = self.get_video_info(url)
             
             if not info:
                 return DownloadResult(
@@ -306,8 +539,7 @@ class AudioDownloader:
                 filename = custom_filename
             else:
                 safe_title = self._sanitize_filename(title)
-                timestamp = int(time.time())
-                filename = f"{safe_title}_{timestamp}"
+                filename = f"{safe_title}_{self._start_time}_{next(self._counter)}"
             
             # 获取视频质量配置
             video_quality = getattr(self.config, 'video_quality', '720p')
@@ -321,54 +553,34 @@ class AudioDownloader:
                 "360p": "bestvideo[height<=360]+bestaudio/best[height<=360]"
             }
             
-            # 视频下载选项
+            # 视频下载选项（配置了临时目录时先下载到临时目录）
+            output_dir = self.temp_dir or self.download_dir
+            output_dir.mkdir(exist_ok=True, parents=True)
             options = {
+                **self._common_yt_dlp_options(),
                 'format': quality_map.get(video_quality, "bestvideo[height<=720]+bestaudio/best"),
-                'outtmpl': f"{str(self.download_dir / filename)}.%(ext)s",
+                'outtmpl': f"{str(output_dir / filename)}.%(ext)s",
                 'merge_output_format': 'mp4',  # 合并为mp4格式
-                'no_warnings': not self.config.verbose,
-                'quiet': not self.config.verbose,
-                'no_color': not self.config.use_colors,
-                
-                # 反检测措施
-                'force_ipv4': True,
-                'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'referer': 'https://www.youtube.com/',
-                'headers': {
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                },
-                'extractor_args': {
-                    'youtube': {
-                        'player_client': ['android', 'web'],
-                        'skip': ['dash', 'hls'],
-                    }
-                },
-                'cachedir': False,
-                'progress_hooks': [self._progress_hook] if self.progress_callback else []
             }
             
             print(f"📥 开始下载视频...")
             
-            # 下载
+            # 下载（复用已提取的视频信息，避免重复提取）
             with yt_dlp.YoutubeDL(options) as ydl:
-                ydl.download([url])
+                info = ydl.process_ie_result(info, download=True)
+                
+                # 获取下载的文件 (优先使用yt-dlp返回的实际路径)
+                downloaded_file = self._get_downloaded_path(info) or Path(ydl.prepare_filename(info))
             
-            # 查找下载的文件
-            downloaded_files = list(self.download_dir.glob(f"{filename}*"))
-            if not downloaded_files:
+            try:
+                downloaded_file = self._move_to_download_dir(downloaded_file)
+                file_size = downloaded_file.stat().st_size
+            except OSError:
                 return DownloadResult(
                     success=False,
                     error_message="下载完成但找不到文件"
                 )
             
-            downloaded_file = downloaded_files[0]
-            file_size = downloaded_file.stat().st_size
-            
             print(f"✅ 视频下载完成: {downloaded_file.name}")
             print(f"📊 文件大小: {file_size / 1024 / 1024:.1f}MB")
             
@@ -408,10 +620,7 @@ class AudioDownloader:
     def get_supported_sites(self) -> list:
         """获取支持的网站列表"""
         try:
-            with yt_dlp.YoutubeDL() as ydl:
-                extractors = ydl.list_extractors()
-                sites = [extractor.IE_NAME for extractor in extractors[:50]]  # 前50个
-                return sites
+            return list(_supported_sites())
         except Exception:
             return ["youtube", "bilibili", "twitter", "vimeo", "soundcloud"]
 
@@ -7,16 +7,53 @@ AI Transcriber Local Client - Main Program
 import sys
 import os
 import argparse
+import asyncio
 import signal
+import threading
+import contextlib
+import logging
 from pathlib import Path
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 # 添加当前目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import ConfigManager, get_config
 from downloader import AudioDownloader, DownloadResult
-from uploader import ServerUploader, UploadResult
+from uploader import ServerUploader, UploadResult, create_session
+
+# 批量处理时同时上传（及等待转录）的最大任务数
+MAX_UPLOAD_WORKERS = 4
+
+# 当前线程的输出缓冲区（由colored_section设置）
+_output_buffer = threading.local()
+
+
+def _write_line(line: str):
+    """写入一行输出；处于colored_section内时仅追加到缓冲区"""
+    lines = getattr(_output_buffer, 'lines', None)
+    if lines is None:
+        print(line)
+    else:
+        lines.append(line + '\n')
+
+
+@contextlib.contextmanager
+def colored_section():
+    """缓冲一段colored_print输出，结束时一次性写入并刷新stdout"""
+    if getattr(_output_buffer, 'lines', None) is not None:
+        # 嵌套时由最外层统一输出
+        yield
+        return
+    _output_buffer.lines = []
+    try:
+        yield
+    finally:
+        lines, _output_buffer.lines = _output_buffer.lines, None
+        sys.stdout.write(''.join(lines))
+        sys.stdout.flush()
+
 
 # 颜色输出支持
 try:
@@ -35,11 +72,11 @@ try:
             'bright_red': Fore.LIGHTRED_EX,
             'bright_green': Fore.LIGHTGREEN_EX,
         }
-        print(colors.get(color, Fore.WHITE) + text)
+        _write_line(colors.get(color, Fore.WHITE) + text)
         
 except ImportError:
     def colored_print(text: str, color: str = 'white'):
-        print(text)
+        _write_line(text)
 
 
 class TranscriberClient:
@@ -48,10 +85,15 @@ class TranscriberClient:
     def __init__(self):
         """初始化客户端"""
         self.config = get_config()
+        self.session = create_session()  # 复用连接，避免每次请求重新握手
         self.downloader = AudioDownloader()
-        self.uploader = ServerUploader()
+        self.uploader = ServerUploader(session=self.session)
         self.current_operation = None
         
+        # 批量处理时的流水线线程池，以及通知工作线程停止的事件
+        self._stop = threading.Event()
+        self._pipeline_executor: Optional[ThreadPoolExecutor] = None
+        
         # 设置信号处理器
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -63,10 +105,21 @@ class TranscriberClient:
         if self.current_operation:
             colored_print("🛑 正在中断当前操作...", 'yellow')
         
+        # 通知流水线停止：等待转录的线程立即返回，不再开始新的下载/上传
+        self._stop.set()
+        executor = self._pipeline_executor
+        if executor is not None:
+            executor.shutdown(wait=False)
+        
         # 清理临时文件
         self.downloader.cleanup_temp_files()
+        self.session.close()
         
         colored_print("👋 程序已退出", 'cyan')
+        if executor is not None:
+            # 工作线程中的下载/上传无法中断，解释器退出时会等待它们结束，因此直接退出进程
+            sys.stdout.flush()
+            os._exit(0)
         sys.exit(0)
     
     def show_banner(self):
@@ -95,6 +148,7 @@ class TranscriberClient:
   
 高级用法:
   python main.py <视频URL> [选项]
+  python main.py <视频URL1> <视频URL2> ... [选项]   并发处理多个URL
 
 📋 可用选项:
   -h, --help           显示此帮助信息
@@ -118,28 +172,30 @@ class TranscriberClient:
     
     def run_system_test(self):
         """运行系统测试"""
-        colored_print("🧪 运行系统测试...", 'blue')
-        
-        # 测试1: 配置检查
-        colored_print("\n1️⃣ 配置检查", 'yellow')
-        config = get_config()
-        colored_print(f"✅ 服务器地址: {config.server_url}")
-        colored_print(f"✅ 下载目录: {config.download_dir}")
-        colored_print(f"✅ 音频质量: {config.audio_quality}")
+        # 每个测试阶段的输出缓冲后一次性写出
+        with colored_section():
+            colored_print("🧪 运行系统测试...", 'blue')
+            
+            # 测试1: 配置检查
+            colored_print("\n1️⃣ 配置检查", 'yellow')
+            config = get_config()
+            colored_print(f"✅ 服务器地址: {config.server_url}")
+            colored_print(f"✅ 下载目录: {config.download_dir}")
+            colored_print(f"✅ 音频质量: {config.audio_quality}")
         
         # 测试2: 下载器检查
-        colored_print("\n2️⃣ 下载器检查", 'yellow')
-        try:
-            downloader = AudioDownloader()
-            sites = downloader.get_supported_sites()
-            colored_print(f"✅ yt-dlp可用，支持{len(sites)}个平台")
-            colored_print(f"   热门平台: {', '.join(sites[:5])}")
-        except Exception as e:
-            colored_print(f"❌ 下载器检查失败: {e}", 'red')
+        with colored_section():
+            colored_print("\n2️⃣ 下载器检查", 'yellow')
+            try:
+                sites = self.downloader.get_supported_sites()
+                colored_print(f"✅ yt-dlp可用，支持{len(sites)}个平台")
+                colored_print(f"   热门平台: {', '.join(sites[:5])}")
+            except Exception as e:
+                colored_print(f"❌ 下载器检查失败: {e}", 'red')
         
         # 测试3: 服务器连接
         colored_print("\n3️⃣ 服务器连接检查", 'yellow')
-        uploader = ServerUploader()
+        uploader = ServerUploader(session=self.session)
         if uploader.test_connection():
             colored_print("✅ 服务器连接正常")
         else:
@@ -158,21 +214,104 @@ class TranscriberClient:
         Returns:
             bool: 处理是否成功
         """
+        download_result = self._download_step(url)
+        if download_result is None:
+            return False
+        return self._upload_step(download_result, wait_for_completion)
+    
+    async def process_urls(self, urls: List[str], wait_for_completion: bool = False) -> bool:
+        """
+        并发处理多个视频URL
+        
+        下载和上传组成流水线：下载线程将结果放入上传队列，上传线程并行消费，
+        使下载和上传（及等待转录）两个阶段相互重叠。
+        
+        Args:
+            urls: 视频URL列表
+            wait_for_completion: 是否等待转录完成
+        
+        Returns:
+            bool: 是否全部处理成功
+        """
+        loop = asyncio.get_running_loop()
+        self._stop.clear()
+        url_queue: asyncio.Queue = asyncio.Queue()
+        upload_queue: asyncio.Queue = asyncio.Queue()
+        for url in urls:
+            url_queue.put_nowait(url)
+        results: List[bool] = []
+        
+        async def download_worker():
+            while not self._stop.is_set():
+                try:
+                    url = url_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                download_result = await loop.run_in_executor(executor, self._download_step, url)
+                if download_result is None:
+                    results.append(False)
+                else:
+                    await upload_queue.put(download_result)
+        
+        async def upload_worker():
+            while True:
+                download_result = await upload_queue.get()
+                if download_result is None or self._stop.is_set():
+                    return
+                results.append(await loop.run_in_executor(
+                    executor, self._upload_step, download_result, wait_for_completion))
+        
+        # 同时下载的数量受配置限制，避免触发视频平台限流
+        download_workers = max(1, min(self.config.concurrent_downloads, len(urls)))
+        upload_workers = max(1, min(MAX_UPLOAD_WORKERS, len(urls)))
+        
+        # 使用独立线程池（而非事件循环默认线程池），中断时无需等待其中的任务
+        executor = ThreadPoolExecutor(max_workers=download_workers + upload_workers,
+                                      thread_name_prefix='pipeline')
+        self._pipeline_executor = executor
         try:
-            colored_print(f"\n🎯 开始处理: {url}", 'blue')
-            
-            # 步骤1: 下载音频
-            colored_print("\n📥 步骤 1/3: 下载音频", 'yellow')
+            uploaders = [asyncio.ensure_future(upload_worker()) for _ in range(upload_workers)]
+            await asyncio.gather(*(download_worker() for _ in range(download_workers)))
+            for _ in uploaders:
+                upload_queue.put_nowait(None)
+            await asyncio.gather(*uploaders)
+        finally:
+            self._pipeline_executor = None
+            executor.shutdown(wait=False)
+        
+        colored_print(f"\n📊 批量处理完成: {sum(results)}/{len(urls)} 成功",
+                      'green' if all(results) else 'yellow')
+        return all(results)
+    
+    def _download_step(self, url: str) -> Optional[DownloadResult]:
+        """步骤1: 下载音频，失败时返回None"""
+        try:
+            with colored_section():
+                colored_print(f"\n🎯 开始处理: {url}", 'blue')
+                
+                # 步骤1: 下载音频
+                colored_print("\n📥 步骤 1/3: 下载音频", 'yellow')
             self.current_operation = "downloading"
             
             download_result = self.downloader.download_audio(url)
             
             if not download_result.success:
                 colored_print(f"❌ 下载失败: {download_result.error_message}", 'red')
-                return False
+                return None
             
             colored_print(f"✅ 下载成功: {download_result.title}", 'green')
+            return download_result
             
+        except KeyboardInterrupt:
+            colored_print("\n⚠️ 用户中断操作", 'yellow')
+            return None
+        except Exception as e:
+            colored_print(f"\n❌ 处理异常: {e}", 'red')
+            return None
+    
+    def _upload_step(self, download_result: DownloadResult, wait_for_completion: bool) -> bool:
+        """步骤2/3: 上传到服务器并（可选）等待转录完成"""
+        try:
             # 步骤2: 上传到服务器
             colored_print("\n📤 步骤 2/3: 上传到服务器", 'yellow')
             self.current_operation = "uploading"
@@ -196,32 +335,35 @@ class TranscriberClient:
                 colored_print("\n⏳ 步骤 3/3: 等待转录完成", 'yellow')
                 self.current_operation = "transcribing"
                 
-                result = self.uploader.wait_for_completion(upload_result.task_id)
+                result = self.uploader.wait_for_completion(upload_result.task_id, stop_event=self._stop)
+            
+            # 结果摘要作为一个整体输出，并发处理时不会与其他任务交错
+            with colored_section():
+                if wait_for_completion:
+                    if result.get('status') == 'completed':
+                        colored_print("🎉 转录完成!", 'bright_green')
+                        
+                        # 显示结果摘要
+                        transcription = result.get('result', {})
+                        if transcription:
+                            text_preview = transcription.get('text', '')[:200]
+                            colored_print(f"📝 转录预览: {text_preview}...", 'cyan')
+                    else:
+                        colored_print(f"⚠️ 转录未完成: {result.get('error', '未知错误')}", 'yellow')
+                        colored_print(f"💡 请使用任务ID查询结果: {upload_result.task_id}", 'blue')
+                else:
+                    colored_print(f"\n💡 转录任务已提交，任务ID: {upload_result.task_id}", 'blue')
+                    colored_print("   使用 --wait 选项可等待转录完成", 'blue')
                 
-                if result.get('status') == 'completed':
-                    colored_print("🎉 转录完成!", 'bright_green')
-                    
-                    # 显示结果摘要
-                    transcription = result.get('result', {})
-                    if transcription:
-                        text_preview = transcription.get('text', '')[:200]
-                        colored_print(f"📝 转录预览: {text_preview}...", 'cyan')
+                # 清理本地文件（如果配置了不保留）
+                if not self.config.keep_local_files:
+                    try:
+                        os.remove(download_result.file_path)
+                        colored_print(f"🧹 已清理本地文件: {download_result.file_path}", 'cyan')
+                    except Exception as e:
+                        colored_print(f"⚠️ 清理本地文件失败: {e}", 'yellow')
                 else:
-                    colored_print(f"⚠️ 转录未完成: {result.get('error', '未知错误')}", 'yellow')
-                    colored_print(f"💡 请使用任务ID查询结果: {upload_result.task_id}", 'blue')
-            else:
-                colored_print(f"\n💡 转录任务已提交，任务ID: {upload_result.task_id}", 'blue')
-                colored_print("   使用 --wait 选项可等待转录完成", 'blue')
-            
-            # 清理本地文件（如果配置了不保留）
-            if not self.config.keep_local_files:
-                try:
-                    os.remove(download_result.file_path)
-                    colored_print(f"🧹 已清理本地文件: {download_result.file_path}", 'cyan')
-                except Exception as e:
-                    colored_print(f"⚠️ 清理本地文件失败: {e}", 'yellow')
-            else:
-                colored_print(f"💾 本地文件已保留: {download_result.file_path}", 'cyan')
+                    colored_print(f"💾 本地文件已保留: {download_result.file_path}", 'cyan')
             
             self.current_operation = None
             return True
@@ -236,7 +378,7 @@ class TranscriberClient:
     def interactive_mode(self):
         """交互模式"""
         colored_print("\n🎮 进入交互模式", 'blue')
-        colored_print("输入视频URL开始转录，输入 'quit' 退出\n")
+        colored_print("输入视频URL开始转录（可连续输入多个URL，空行结束），输入 'quit' 退出\n")
         
         while True:
             try:
@@ -250,22 +392,34 @@ class TranscriberClient:
                     self.show_help()
                     continue
                 elif url.lower() in ['config', 'c']:
-                    ConfigManager().setup_wizard()
-                    # 重新加载配置
-                    self.config = get_config()
-                    self.downloader = AudioDownloader()
-                    self.uploader = ServerUploader()
+                    wizard = ConfigManager()
+                    wizard.setup_wizard()
+                    # 应用新配置（保留现有下载器和HTTP连接）
+                    self.config = wizard.config
+                    self.downloader.update_config(self.config)
+                    self.uploader.update_config(self.config)
                     continue
                 elif url.lower() in ['test', 't']:
                     self.run_system_test()
                     continue
                 
+                # 收集更多URL，空行结束
+                urls = [url]
+                while True:
+                    more = input("🔗 继续输入URL（直接回车开始处理）: ").strip()
+                    if not more:
+                        break
+                    urls.append(more)
+                
                 # 询问是否等待完成
                 wait_input = input("⏳ 是否等待转录完成？[y/N]: ").strip().lower()
                 wait = wait_input in ['y', 'yes', '是']
                 
-                # 处理URL
-                success = self.process_url(url, wait_for_completion=wait)
+                # 处理URL（多个URL并发处理）
+                if len(urls) == 1:
+                    success = self.process_url(url, wait_for_completion=wait)
+                else:
+                    success = asyncio.run(self.process_urls(urls, wait_for_completion=wait))
                 
                 if success:
                     colored_print("✅ 任务完成!", 'green')
@@ -297,9 +451,10 @@ def main():
     
     # 位置参数
     parser.add_argument(
-        'url', 
-        nargs='?',
-        help='视频URL'
+        'urls', 
+        nargs='*',
+        metavar='url',
+        help='视频URL（可指定多个，将并发处理）'
     )
     
     # 可选参数
@@ -379,6 +534,12 @@ def main():
         config_manager.set('keep_local_files', True)
     if args.verbose:
         config_manager.set('verbose', True)
+        # 显示上传器的调试信息（服务器地址、连接探测等），不开启urllib3等第三方库的调试日志
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        uploader_log = logging.getLogger('uploader')
+        uploader_log.addHandler(handler)
+        uploader_log.setLevel(logging.DEBUG)
     if args.no_color:
         config_manager.set('use_colors', False)
     
@@ -391,9 +552,14 @@ def main():
         # 运行系统测试
         client.run_system_test()
         
-    elif args.url:
+    elif len(args.urls) == 1:
         # 处理单个URL
-        success = client.process_url(args.url, wait_for_completion=args.wait)
+        success = client.process_url(args.urls[0], wait_for_completion=args.wait)
+        sys.exit(0 if success else 1)
+        
+    elif args.urls:
+        # 并发处理多个URL
+        success = asyncio.run(client.process_urls(args.urls, wait_for_completion=args.wait))
         sys.exit(0 if success else 1)
         
     else:
@@ -9,6 +9,7 @@ GUI Launcher - AI Transcriber Client
 import sys
 import os
 import subprocess
+import importlib.util
 from pathlib import Path
 
 def check_requirements():
@@ -26,18 +27,11 @@ def check_requirements():
     required_modules = ['tkinter', 'requests', 'yt_dlp', 'tqdm']
     missing_modules = []
     
+    # 仅检查模块是否存在，不实际导入（实际导入推迟到启动GUI时）
     for module in required_modules:
-        try:
-            if module == 'tkinter':
-                import tkinter
-            elif module == 'requests':
-                import requests
-            elif module == 'yt_dlp':
-                import yt_dlp
-            elif module == 'tqdm':
-                import tqdm
+        if importlib.util.find_spec(module) is not None:
             print(f"✅ {module} 已安装")
-        except ImportError:
+        else:
             missing_modules.append(module)
             print(f"❌ {module} 未安装")
     
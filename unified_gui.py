@@ -7,20 +7,73 @@ Unified GUI Program - AI Transcriber Client
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
 import threading
+import asyncio
 import os
 import sys
+import re
 from pathlib import Path
 import json
-from typing import Optional, Dict, Any
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, TYPE_CHECKING
+
+# 导入我们的模块（下载器和上传器依赖yt-dlp/requests，首次使用时再导入）
+from config import get_config, ConfigManager, config_manager
+
+if TYPE_CHECKING:
+    import requests
+    from downloader import AudioDownloader
+    from uploader import ServerUploader
+
+# 帮助窗口的静态文本（各行均较短，显示时无需自动换行）
+HELP_TEXT = """
+🎤 AI转录器本地客户端 - 使用帮助
+
+📋 主要功能:
+• 📹 下载视频: 下载视频文件到本地
+• 🎵 下载音频: 下载音频文件到本地  
+• 🎤 下载并转录: 下载音频并上传到服务器转录
+
+🌐 支持的网站:
+• YouTube, Bilibili, Twitter, Vimeo
+• SoundCloud 等数百个视频平台
+
+⚙️ 配置选项:
+• 音频质量: best(最佳), good(良好), fast(快速)
+• 下载目录: 可自定义文件保存位置
+• 服务器设置: 转录服务器地址和API密钥
+
+🔧 使用步骤:
+1. 输入或粘贴视频URL
+2. 选择对应的操作
+3. 等待处理完成
+
+❓ 常见问题:
+• 403错误: 程序已集成最新反检测策略
+• 网络问题: 检查网络连接和防火墙设置
+• 服务器错误: 检查服务器地址和API密钥配置
+
+📞 获取支持:
+如有问题请联系技术支持或查看项目文档。
+"""
 
-# 导入我们的模块
-from config import get_config, ConfigManager
-from downloader import AudioDownloader, DownloadResult  
-from uploader import ServerUploader, UploadResult
 
 class UnifiedTranscriberGUI:
     """统一转录器GUI界面"""
     
+    # 日志框最多保留的行数
+    MAX_LOG_LINES = 1000
+    # 日志批量刷新间隔（毫秒）
+    LOG_FLUSH_INTERVAL = 100
+    # 进度条刷新间隔（毫秒），即最高20Hz
+    PROGRESS_PUMP_INTERVAL = 50
+    # 粘贴URL时最多读取的字符数
+    MAX_PASTE_LENGTH = 2048
+    # 有效URL：http(s)://开头且不含空白字符
+    _URL_RE = re.compile(r'^https?://\S+$')
+    # 同时执行的下载任务数，其余任务排队
+    MAX_JOB_WORKERS = 2
+    
     def __init__(self):
         """初始化GUI"""
         self.root = tk.Tk()
@@ -30,37 +83,79 @@ class UnifiedTranscriberGUI:
         
         # 配置
         self.config = get_config()
-        self.config_manager = ConfigManager()
+        self.config_manager = config_manager
+        
+        # 工具实例（延迟创建，窗口先显示出来）
+        self._downloader: Optional['AudioDownloader'] = None
+        self._uploader: Optional['ServerUploader'] = None
+        self._session: Optional['requests.Session'] = None  # 所有服务器请求共用的HTTP会话
+        self._tools_lock = threading.Lock()
+        
+        # 任务线程池（复用工作线程，多余的任务自动排队）及进行中的任务数
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_JOB_WORKERS, thread_name_prefix='job')
+        self._jobs_in_flight = 0
+        self._pool_pending = 0  # 已提交到线程池但尚未完成的调用数（含排队中的）
+        self._pool_lock = threading.Lock()
         
-        # 工具实例
-        self.downloader = AudioDownloader()
-        self.uploader = ServerUploader()
+        # 后台事件循环：转录任务在其中以协程运行，等待期间不占用线程
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="gui-event-loop", daemon=True).start()
         
-        # 设置进度回调
-        self.downloader.set_progress_callback(self._progress_callback)
-        self.uploader.set_progress_callback(self._progress_callback)
+        # 待写入日志框的消息（批量刷新）
+        self._log_queue = collections.deque(maxlen=self.MAX_LOG_LINES)
+        self._log_pending = False
         
-        # 当前任务
-        self.current_task = None
-        self.current_thread = None
+        # 工作线程写入的最新进度 (status, percent)，由_pump_progress在UI线程中应用
+        self._last_progress = None
+        self._shown_progress = None
+        
+        # 帮助窗口（首次打开时创建，关闭时仅隐藏）
+        self._help_window: Optional[tk.Toplevel] = None
         
         # 初始化界面
-        self._setup_ui()
         self._setup_styles()
+        self._setup_ui()
+        self.root.after(self.PROGRESS_PUMP_INTERVAL, self._pump_progress)
         
         print("🎮 GUI界面已启动")
     
+    @property
+    def downloader(self) -> 'AudioDownloader':
+        """音频下载器（首次访问时导入并创建）"""
+        if self._downloader is None:
+            with self._tools_lock:
+                if self._downloader is None:
+                    from downloader import AudioDownloader
+                    downloader = AudioDownloader()
+                    downloader.set_progress_callback(self._progress_callback)
+                    self._downloader = downloader
+        return self._downloader
+    
+    @property
+    def uploader(self) -> 'ServerUploader':
+        """服务器上传器（首次访问时导入并创建）"""
+        if self._uploader is None:
+            with self._tools_lock:
+                if self._uploader is None:
+                    from uploader import ServerUploader, create_session
+                    self._session = create_session()
+                    uploader = ServerUploader(session=self._session)
+                    uploader.set_progress_callback(self._progress_callback)
+                    self._uploader = uploader
+        return self._uploader
+    
     def _setup_styles(self):
-        """设置界面样式"""
+        """设置界面样式（在创建控件之前调用，一次性写入当前主题）"""
         style = ttk.Style()
-        
-        # 配置按钮样式
-        style.configure('Action.TButton', font=('Arial', 10, 'bold'))
-        style.configure('Config.TButton', font=('Arial', 9))
-        
-        # 配置标签样式
-        style.configure('Title.TLabel', font=('Arial', 14, 'bold'))
-        style.configure('Subtitle.TLabel', font=('Arial', 10))
+        style.theme_settings(style.theme_use(), {
+            # 按钮样式
+            'Action.TButton': {'configure': {'font': ('Arial', 10, 'bold')}},
+            'Config.TButton': {'configure': {'font': ('Arial', 9)}},
+            
+            # 标签样式
+            'Title.TLabel': {'configure': {'font': ('Arial', 14, 'bold')}},
+            'Subtitle.TLabel': {'configure': {'font': ('Arial', 10)}},
+        })
     
     def _setup_ui(self):
         """设置用户界面"""
@@ -146,7 +241,7 @@ class UnifiedTranscriberGUI:
         status_label.grid(row=0, column=1, padx=(10, 0))
         
         # 日志文本框
-        self.log_text = scrolledtext.ScrolledText(progress_frame, height=15, font=('Consolas', 9))
+        self.log_text = scrolledtext.ScrolledText(progress_frame, height=15, font=('Consolas', 9), state=tk.DISABLED)
         self.log_text.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # 底部状态栏
@@ -158,41 +253,97 @@ class UnifiedTranscriberGUI:
         server_label = ttk.Label(status_frame, textvariable=self.server_status_var)
         server_label.grid(row=0, column=0, sticky=tk.W)
         
-        # 初始化检查服务器连接
-        threading.Thread(target=self._check_server_connection, daemon=True).start()
+        # 主循环启动后检查服务器连接
+        self.root.after(100, self._kick_health_check)
     
     def _paste_url(self):
         """粘贴URL"""
         try:
-            clipboard = self.root.clipboard_get()
-            self.url_var.set(clipboard)
+            try:
+                clipboard = self.root.clipboard_get(type='UTF8_STRING')
+            except tk.TclError:
+                # 部分平台不支持UTF8_STRING类型
+                clipboard = self.root.clipboard_get()
+            if len(clipboard) > self.MAX_PASTE_LENGTH:
+                self._log("⚠️ 剪贴板过大，已截断")
+                clipboard = clipboard[:self.MAX_PASTE_LENGTH]
+            self.url_var.set(clipboard.strip())
             self._log("📋 已粘贴URL")
         except tk.TclError:
             self._log("⚠️ 剪贴板为空或无法访问")
     
     def _log(self, message: str):
-        """添加日志"""
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """添加日志（先入队，由_flush_log批量写入日志框）"""
+        self._log_queue.append(message)
+        if not self._log_pending:
+            self._log_pending = True
+            self.root.after(self.LOG_FLUSH_INTERVAL, self._flush_log)
+    
+    def _flush_log(self):
+        """将排队的日志一次性写入日志框，并批量删除超出上限的旧行"""
+        self._log_pending = False
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        if not lines:
+            return
+        
+        # 仅当用户停留在底部时自动滚动，向上翻看日志时保持当前位置
+        at_bottom = self.log_text.yview()[1] >= 0.999
+        
+        # 日志框平时为只读，仅在批量写入期间可编辑
+        self.log_text.configure(state=tk.NORMAL)
+        self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+        
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        extra = line_count - self.MAX_LOG_LINES
+        if extra > 0:
+            self.log_text.delete('1.0', f'{extra + 1}.0')
+        self.log_text.configure(state=tk.DISABLED)
+        
+        if at_bottom:
+            self.log_text.yview_moveto(1.0)
     
     def _progress_callback(self, data: Dict[str, Any]):
-        """进度回调函数"""
-        if data.get('status') == 'downloading':
-            percent = data.get('percent', 0)
-            self.progress_var.set(percent)
-            self.status_var.set(f"下载中 {percent:.1f}%")
-        elif data.get('status') == 'uploading':
-            percent = data.get('percent', 0)
-            self.progress_var.set(percent)
-            self.status_var.set(f"上传中 {percent:.1f}%")
-        elif data.get('status') == 'finished':
-            self.progress_var.set(100)
-            self.status_var.set("完成")
-    
-    def _check_server_connection(self):
+        """进度回调函数（可能在工作线程中调用，只记录最新进度）"""
+        self._last_progress = (data.get('status'), data.get('percent', 0))
+    
+    def _pump_progress(self):
+        """在UI线程中定期把最新进度写入进度条和状态标签，丢弃中间值"""
+        progress = self._last_progress
+        if progress is not None and progress != self._shown_progress:
+            self._shown_progress = progress
+            status, percent = progress
+            if status == 'downloading':
+                self.progress_var.set(percent)
+                self.status_var.set(f"下载中 {percent:.1f}%")
+            elif status == 'uploading':
+                self.progress_var.set(percent)
+                self.status_var.set(f"上传中 {percent:.1f}%")
+            elif status == 'finished':
+                self.progress_var.set(100)
+                self.status_var.set("完成")
+        
+        self.root.after(self.PROGRESS_PUMP_INTERVAL, self._pump_progress)
+    
+    def _kick_health_check(self):
+        """在后台事件循环中检查服务器连接，结果由UI线程轮询后写入状态栏"""
+        future = asyncio.run_coroutine_threadsafe(self._check_server_connection(), self._loop)
+        self.root.after(100, self._apply_health_check, future)
+    
+    async def _check_server_connection(self) -> bool:
         """检查服务器连接状态"""
-        if self.uploader.test_connection():
+        loop = asyncio.get_running_loop()
+        # 上传器首次创建时需要导入requests，放在线程池中完成以免阻塞事件循环
+        return await loop.run_in_executor(None, lambda: self.uploader.test_connection(True))
+    
+    def _apply_health_check(self, future):
+        """连接检查完成后更新状态栏（仅在UI线程中调用）"""
+        if not future.done():
+            self.root.after(100, self._apply_health_check, future)
+            return
+        
+        if not future.exception() and future.result():
             self.server_status_var.set(f"🌐 服务器连接正常: {self.config.server_url}")
         else:
             self.server_status_var.set("⚠️ 服务器连接失败")
@@ -203,8 +354,8 @@ class UnifiedTranscriberGUI:
         if not url:
             messagebox.showerror("错误", "请输入视频URL")
             return None
-        if not (url.startswith('http://') or url.startswith('https://')):
-            messagebox.showerror("错误", "请输入有效的URL（以http://或https://开头）")
+        if not self._URL_RE.match(url):
+            messagebox.showerror("错误", "请输入有效的URL（以http://或https://开头，且不含空格）")
             return None
         return url
     
@@ -232,24 +383,53 @@ class UnifiedTranscriberGUI:
         if not url:
             return
         
-        # 检查服务器连接
-        if not self.uploader.test_connection():
-            messagebox.showerror("错误", "服务器连接失败，请检查网络或配置")
-            return
-        
         self._log("🎤 开始下载并转录...")
-        self._run_in_thread(self._do_download_and_transcribe, url)
+        self._track_job(asyncio.run_coroutine_threadsafe(
+            self._do_download_and_transcribe(url), self._loop
+        ))
+    
+    def _track_job(self, future):
+        """登记进行中的任务，完成后回到UI线程更新状态"""
+        if self._jobs_in_flight == 0:
+            # 开始新一批任务前重置进度显示
+            self._last_progress = self._shown_progress = None
+            self.progress_var.set(0)
+            self.status_var.set("处理中...")
+        self._jobs_in_flight += 1
+        future.add_done_callback(lambda f: self.root.after(0, self._job_done, f))
+    
+    def _job_done(self, future):
+        """任务完成回调（在UI线程中执行）"""
+        self._jobs_in_flight -= 1
+        if not future.cancelled() and future.exception():
+            self._log(f"❌ 任务异常: {future.exception()}")
+        if self._jobs_in_flight == 0:
+            self.status_var.set("就绪")
+    
+    def _ui(self, fn, *args):
+        """把界面操作（如消息框）调度到UI线程执行，可在任意线程中调用"""
+        self.root.after(0, lambda: fn(*args))
+    
+    def _submit(self, func, *args):
+        """提交阻塞调用到任务线程池（可在任意线程中调用），线程池已满时提示排队"""
+        with self._pool_lock:
+            queued = self._pool_pending >= self.MAX_JOB_WORKERS
+            self._pool_pending += 1
+        if queued:
+            self._log("⏳ 任务已排队，将在当前任务完成后开始")
+        
+        def call():
+            try:
+                return func(*args)
+            finally:
+                with self._pool_lock:
+                    self._pool_pending -= 1
+        
+        return self._executor.submit(call)
     
     def _run_in_thread(self, func, *args):
-        """在新线程中运行函数"""
-        if self.current_thread and self.current_thread.is_alive():
-            messagebox.showwarning("警告", "任务正在进行中，请等待完成")
-            return
-        
-        self.progress_var.set(0)
-        self.status_var.set("处理中...")
-        self.current_thread = threading.Thread(target=func, args=args, daemon=True)
-        self.current_thread.start()
+        """在任务线程池中运行函数"""
+        self._track_job(self._submit(func, *args))
     
     def _do_download_video(self, url: str):
         """执行视频下载"""
@@ -261,18 +441,15 @@ class UnifiedTranscriberGUI:
                 self._log(f"✅ 视频下载完成: {result.file_path}")
                 self._log(f"📊 文件大小: {result.file_size / 1024 / 1024:.1f}MB")
                 self._log(f"⏱️ 时长: {result.duration}秒")
-                messagebox.showinfo("成功", f"视频文件已保存到:\n{result.file_path}")
+                self._ui(messagebox.showinfo, "成功", f"视频文件已保存到:\n{result.file_path}")
             else:
                 self._log(f"❌ 下载失败: {result.error_message}")
-                messagebox.showerror("错误", f"下载失败:\n{result.error_message}")
+                self._ui(messagebox.showerror, "错误", f"下载失败:\n{result.error_message}")
         
         except Exception as e:
             error_msg = f"下载异常: {str(e)}"
             self._log(f"❌ {error_msg}")
-            messagebox.showerror("错误", error_msg)
-        
-        finally:
-            self.status_var.set("就绪")
+            self._ui(messagebox.showerror, "错误", error_msg)
     
     def _do_download_audio(self, url: str):
         """执行音频下载"""
@@ -284,69 +461,70 @@ class UnifiedTranscriberGUI:
                 self._log(f"✅ 音频下载完成: {result.file_path}")
                 self._log(f"📊 文件大小: {result.file_size / 1024 / 1024:.1f}MB")
                 self._log(f"⏱️ 时长: {result.duration}秒")
-                messagebox.showinfo("成功", f"音频文件已保存到:\n{result.file_path}")
+                self._ui(messagebox.showinfo, "成功", f"音频文件已保存到:\n{result.file_path}")
             else:
                 self._log(f"❌ 音频下载失败: {result.error_message}")
-                messagebox.showerror("错误", f"音频下载失败:\n{result.error_message}")
+                self._ui(messagebox.showerror, "错误", f"音频下载失败:\n{result.error_message}")
         
         except Exception as e:
             error_msg = f"下载异常: {str(e)}"
             self._log(f"❌ {error_msg}")
-            messagebox.showerror("错误", error_msg)
-        
-        finally:
-            self.status_var.set("就绪")
+            self._ui(messagebox.showerror, "错误", error_msg)
     
-    def _do_download_and_transcribe(self, url: str):
-        """执行下载并转录"""
+    async def _do_download_and_transcribe(self, url: str):
+        """执行下载并转录（在后台事件循环中运行，阻塞调用交给任务线程池，与其他任务共享并发上限）"""
         try:
+            # 检查服务器连接（在线程池中执行，不阻塞界面）
+            # 工具实例在线程池中访问：首次创建时的导入和初始化不会阻塞事件循环
+            if not await asyncio.wrap_future(self._submit(lambda: self.uploader.test_connection(True))):
+                self._log("❌ 服务器连接失败")
+                self._ui(messagebox.showerror, "错误", "服务器连接失败，请检查网络或配置")
+                return
+            
             # 第一步：下载音频
             self._log("🎵 第1步: 下载音频...")
-            download_result = self.downloader.download_audio(url)
+            download_result = await asyncio.wrap_future(self._submit(lambda: self.downloader.download_audio(url)))
             
             if not download_result.success:
                 self._log(f"❌ 音频下载失败: {download_result.error_message}")
-                messagebox.showerror("错误", f"音频下载失败:\n{download_result.error_message}")
+                self._ui(messagebox.showerror, "错误", f"音频下载失败:\n{download_result.error_message}")
                 return
             
             self._log(f"✅ 音频下载完成: {download_result.file_path}")
             
             # 第二步：上传并转录
             self._log("🚀 第2步: 上传并转录...")
-            upload_result = self.uploader.upload_file(download_result.file_path)
+            upload_result = await asyncio.wrap_future(self._submit(lambda: self.uploader.upload_file(download_result.file_path)))
             
             if not upload_result.success:
                 self._log(f"❌ 上传失败: {upload_result.error}")
-                messagebox.showerror("错误", f"上传失败:\n{upload_result.error}")
+                self._ui(messagebox.showerror, "错误", f"上传失败:\n{upload_result.error}")
                 return
             
             self._log(f"✅ 上传成功! 任务ID: {upload_result.task_id}")
             
             # 第三步：等待转录完成
             self._log("⏳ 第3步: 等待转录完成...")
-            final_result = self.uploader.wait_for_completion(upload_result.task_id)
+            final_result = await self.uploader.wait_for_completion_async(upload_result.task_id)
             
             if final_result.get('status') == 'completed':
                 self._log("🎉 转录完成!")
                 
                 # 下载结果
-                result_file = self.uploader.download_result(upload_result.task_id)
+                result_file = await asyncio.wrap_future(self._submit(lambda: self.uploader.download_result(upload_result.task_id)))
                 if result_file:
                     self._log(f"📄 结果已保存: {result_file}")
                 
-                messagebox.showinfo("成功", f"转录完成!\n任务ID: {upload_result.task_id}\n音频文件: {download_result.file_path}")
+                self._ui(messagebox.showinfo, "成功", f"转录完成!\n任务ID: {upload_result.task_id}\n音频文件: {download_result.file_path}")
             else:
                 error_msg = final_result.get('error', '转录失败')
                 self._log(f"❌ 转录失败: {error_msg}")
-                messagebox.showerror("错误", f"转录失败:\n{error_msg}")
+                self._ui(messagebox.showerror, "错误", f"转录失败:\n{error_msg}")
         
         except Exception as e:
             error_msg = f"处理异常: {str(e)}"
             self._log(f"❌ {error_msg}")
-            messagebox.showerror("错误", error_msg)
-        
-        finally:
-            self.status_var.set("就绪")
+            self._ui(messagebox.showerror, "错误", error_msg)
     
     def _open_config(self):
         """打开配置窗口"""
@@ -355,17 +533,18 @@ class UnifiedTranscriberGUI:
     def _reload_config(self):
         """重新加载配置"""
         self.config = get_config()
-        self.downloader = AudioDownloader()
-        self.uploader = ServerUploader()
-        self.downloader.set_progress_callback(self._progress_callback)
-        self.uploader.set_progress_callback(self._progress_callback)
+        # 尚未创建的工具在首次使用时会直接读取新配置
+        if self._downloader is not None:
+            self._downloader.update_config(self.config)
+        if self._uploader is not None:
+            self._uploader.update_config(self.config)
         self._log("🔄 配置已重新加载")
-        threading.Thread(target=self._check_server_connection, daemon=True).start()
+        self._kick_health_check()
     
     def _run_test(self):
         """运行系统测试"""
         self._log("🧪 开始系统测试...")
-        threading.Thread(target=self._do_test, daemon=True).start()
+        self._run_in_thread(self._do_test)
     
     def _do_test(self):
         """执行系统测试"""
@@ -397,45 +576,22 @@ class UnifiedTranscriberGUI:
     
     def _show_help(self):
         """显示帮助信息"""
-        help_text = """
-🎤 AI转录器本地客户端 - 使用帮助
-
-📋 主要功能:
-• 📹 下载视频: 下载视频文件到本地
-• 🎵 下载音频: 下载音频文件到本地  
-• 🎤 下载并转录: 下载音频并上传到服务器转录
-
-🌐 支持的网站:
-• YouTube, Bilibili, Twitter, Vimeo
-• SoundCloud 等数百个视频平台
-
-⚙️ 配置选项:
-• 音频质量: best(最佳), good(良好), fast(快速)
-• 下载目录: 可自定义文件保存位置
-• 服务器设置: 转录服务器地址和API密钥
-
-🔧 使用步骤:
-1. 输入或粘贴视频URL
-2. 选择对应的操作
-3. 等待处理完成
-
-❓ 常见问题:
-• 403错误: 程序已集成最新反检测策略
-• 网络问题: 检查网络连接和防火墙设置
-• 服务器错误: 检查服务器地址和API密钥配置
-
-📞 获取支持:
-如有问题请联系技术支持或查看项目文档。
-        """
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
         
         help_window = tk.Toplevel(self.root)
         help_window.title("帮助")
         help_window.geometry("600x500")
         help_window.transient(self.root)
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+        self._help_window = help_window
         
-        help_text_widget = scrolledtext.ScrolledText(help_window, wrap=tk.WORD, font=('Arial', 10))
+        # 关闭自动换行，Tk无需为每段文字计算折行
+        help_text_widget = scrolledtext.ScrolledText(help_window, wrap=tk.NONE, font=('Arial', 10))
         help_text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        help_text_widget.insert(tk.END, help_text)
+        help_text_widget.insert(tk.END, HELP_TEXT)
         help_text_widget.config(state=tk.DISABLED)
     
     def run(self):
@@ -446,6 +602,19 @@ class UnifiedTranscriberGUI:
             print("\n👋 用户退出")
         except Exception as e:
             print(f"❌ GUI异常: {e}")
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._executor.shutdown(wait=False)
+            if self._session is not None:
+                self._session.close()
+            
+            with self._pool_lock:
+                busy = self._pool_pending > 0
+            if busy:
+                # 线程池的工作线程会在解释器退出时被等待，窗口关闭后不应让下载继续在后台运行
+                print("🛑 窗口已关闭，终止未完成的任务")
+                sys.stdout.flush()
+                os._exit(0)
 
 
 class ConfigWindow:
@@ -537,6 +706,35 @@ class ConfigWindow:
         ttk.Button(button_frame, text="保存", command=self._save_config).pack(side=tk.RIGHT, padx=(5, 0))
         ttk.Button(button_frame, text="取消", command=self.window.destroy).pack(side=tk.RIGHT)
         ttk.Button(button_frame, text="恢复默认", command=self._reset_defaults).pack(side=tk.LEFT)
+        
+        # 输入提示（停止输入300毫秒后再校验，避免每次按键都校验）
+        self.hint_var = tk.StringVar()
+        ttk.Label(button_frame, textvariable=self.hint_var, foreground="#cc6600").pack(side=tk.LEFT, padx=(10, 0))
+        self._debounce(self.server_url_var, self._validate_fields)
+        self._debounce(self.download_dir_var, self._validate_fields)
+    
+    def _debounce(self, var: tk.Variable, fn, ms: int = 300):
+        """变量变化时延迟执行fn，连续变化只在最后一次变化后执行一次"""
+        job = [None]
+        
+        def on_change(*_):
+            if job[0] is not None:
+                self.window.after_cancel(job[0])
+            job[0] = self.window.after(ms, fn)
+        
+        var.trace_add('write', on_change)
+    
+    def _validate_fields(self):
+        """实时校验输入并显示提示"""
+        server_url = self.server_url_var.get().strip()
+        if not server_url:
+            self.hint_var.set("⚠️ 服务器地址不能为空")
+        elif not server_url.startswith(('http://', 'https://')):
+            self.hint_var.set("⚠️ 服务器地址应以http://或https://开头")
+        elif not self.download_dir_var.get().strip():
+            self.hint_var.set("⚠️ 下载目录不能为空")
+        else:
+            self.hint_var.set("")
     
     def _browse_directory(self):
         """浏览目录"""
@@ -5,16 +5,125 @@ Server Upload Module
 """
 
 import os
+import asyncio
+import shutil
+import socket
+import uuid
+import http.client
 import requests
 import json
 import time
+import logging
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Tuple, List, Iterable, Set
+from urllib.parse import urljoin, urlparse
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from tqdm import tqdm
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+# 流式multipart编码，上传时无需把整个文件读入内存并可报告进度（requirements.txt中的必需依赖；
+# 缺失时回退到requests的files=上传）
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder, MultipartEncoderMonitor
+except ImportError:
+    MultipartEncoder = MultipartEncoderMonitor = None
+
+# 可选：以zstd压缩上传请求体（需服务器支持 Content-Encoding: zstd）
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# JSON解析支持（优先使用orjson，轮询状态时解析更快）
+try:
+    import orjson
+    def _json_loads(data: bytes) -> Any: return orjson.loads(data)
+except ImportError:
+    def _json_loads(data: bytes) -> Any: return json.loads(data)
+
+from config import get_config, ClientConfig
+
+log = logging.getLogger(__name__)
+
+
+class _LargeSendBufferAdapter(HTTPAdapter):
+    """增大套接字发送缓冲区的适配器，便于在高带宽高延迟链路上保持更多在途数据"""
+    
+    SEND_BUFFER_SIZE = 4 * 1024 * 1024
+    
+    def init_poolmanager(self, *args, **kwargs):
+        # 在urllib3默认选项（TCP_NODELAY）基础上追加SO_SNDBUF
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_SNDBUF, self.SEND_BUFFER_SIZE)
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_session(pool_size: int = 32, large_upload_tuning: Optional[bool] = None) -> requests.Session:
+    """
+    创建带连接池和重试策略的HTTP会话（urllib3默认已启用TCP_NODELAY）
+    
+    Args:
+        pool_size: 连接池大小
+        large_upload_tuning: 是否增大发送缓冲区，默认取配置中的large_upload_tuning
+    """
+    if large_upload_tuning is None:
+        large_upload_tuning = get_config().large_upload_tuning
+    
+    session = requests.Session()
+    # 服务器暂时不可用(502/503/504)时按指数退避重试，避免轮询时频繁重连；
+    # 连接失败和读取超时不重试，否则探测已关闭的端口时每个请求都要等待数秒退避；
+    # 上传(POST)不会自动重试：流式请求体无法重放，且重复提交会创建重复任务
+    retry = Retry(
+        total=5,
+        connect=0,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        raise_on_status=False
+    )
+    adapter_class = _LargeSendBufferAdapter if large_upload_tuning else HTTPAdapter
+    adapter = adapter_class(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    # 声明urllib3实际能解码的全部压缩格式（安装brotli/zstandard后自动包含br/zstd）
+    session.headers['Accept-Encoding'] = make_headers(accept_encoding=True)['accept-encoding']
+    return session
+
+
+def _listening_ports() -> Optional[Set[int]]:
+    """
+    读取 /proc/net/tcp 与 /proc/net/tcp6，返回处于监听状态的TCP端口
+    
+    Returns:
+        Optional[Set[int]]: 监听端口集合；非Linux系统或无法读取时返回None
+    """
+    ports = set()
+    found = False
+    for table in ('/proc/net/tcp', '/proc/net/tcp6'):
+        try:
+            with open(table, 'r') as f:
+                next(f, None)  # 跳过表头
+                for line in f:
+                    fields = line.split()
+                    # fields[1]为 "十六进制地址:十六进制端口"，fields[3]为连接状态，0A表示LISTEN
+                    if len(fields) > 3 and fields[3] == '0A':
+                        ports.add(int(fields[1].rsplit(':', 1)[1], 16))
+            found = True
+        except (OSError, ValueError, IndexError):
+            continue
+    return ports if found else None
 
-from config import get_config
 
 @dataclass
 class UploadResult:
@@ -29,10 +138,36 @@ class UploadResult:
 class ServerUploader:
     """服务器上传器"""
     
-    def __init__(self):
-        """初始化上传器"""
+    # 连接测试结果的缓存有效期（秒）
+    CONNECTION_CACHE_TTL = 10.0
+    
+    # 上传进度回调的最小间隔（秒）
+    PROGRESS_INTERVAL = 0.1
+    
+    # 上传到本机明文HTTP服务器且文件不小于该值时，使用sendfile零拷贝发送
+    SENDFILE_MIN_SIZE = 16 * 1024 * 1024
+    SENDFILE_CHUNK = 8 * 1024 * 1024
+    
+    # 自动检测时探测的常见本地服务器端口
+    LOCAL_PORTS = (8000, 8001, 8002, 8003, 8888, 8889, 5000, 3000)
+    
+    # 任务状态轮询：状态不变时间隔按倍数增长，直至上限；状态变化时恢复初始间隔
+    POLL_BACKOFF = 1.7
+    MAX_POLL_INTERVAL = 30.0
+    
+    # 未经压缩的PCM音频，启用compress_upload时上传前以zstd压缩
+    COMPRESSIBLE_SUFFIXES = ('.wav', '.wave', '.aif', '.aiff')
+    COMPRESS_READ_SIZE = 1024 * 1024
+    
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        初始化上传器
+        
+        Args:
+            session: 共享的HTTP会话，默认创建新的会话
+        """
         self.config = get_config()
-        self.session = requests.Session()
+        self.session = session or create_session()
         
         # 设置默认头部
         self.session.headers.update({
@@ -40,67 +175,142 @@ class ServerUploader:
             'Accept': 'application/json'
         })
         
-        # API密钥
-        if self.config.api_key:
-            self.session.headers['Authorization'] = f'Bearer {self.config.api_key}'
-        
         self.progress_callback: Optional[Callable] = None
         
-        print(f"🌐 服务器: {self.config.server_url}")
+        # 最近一次连接测试结果 (服务器地址, 测试时间, 是否成功)
+        self._conn_cache: Optional[Tuple[str, float, bool]] = None
+        
+        # 任务状态条件请求缓存：task_id -> ETag / 上次的状态数据
+        self._etag_cache: Dict[str, str] = {}
+        self._status_cache: Dict[str, Dict[str, Any]] = {}
+        
+        self.update_config(self.config)
+        
+        log.debug("🌐 服务器: %s", self.config.server_url)
+    
+    def update_config(self, config: ClientConfig):
+        """
+        应用新配置（复用现有HTTP会话，保留连接池中的连接）
+        
+        Args:
+            config: 新的客户端配置
+        """
+        self.config = config
+        self._rebuild_urls()
+        
+        # API密钥
+        if config.api_key:
+            self.session.headers['Authorization'] = f'Bearer {config.api_key}'
+        else:
+            self.session.headers.pop('Authorization', None)
     
     def set_progress_callback(self, callback: Callable):
-        """设置进度回调函数"""
+        """设置进度回调函数（上传时传入的进度字典会被复用，回调中不要保留其引用）"""
         self.progress_callback = callback
     
+    def _rebuild_urls(self):
+        """根据当前服务器地址预先生成各API地址"""
+        self._url_source = self.config.server_url
+        self._base_url = self._url_source.rstrip('/')
+        self._upload_url = f"{self._base_url}/api/transcribe/file"
+        self._task_status_fmt = f"{self._base_url}/api/task/{{}}"
+    
+    def _get_base_url(self) -> str:
+        """获取服务器基础地址（配置中的地址被直接修改时自动重新生成）"""
+        if self.config.server_url != self._url_source:
+            self._rebuild_urls()
+        return self._base_url
+    
     def _get_upload_url(self) -> str:
         """获取文件上传API地址"""
-        base_url = self.config.server_url.rstrip('/')
-        return f"{base_url}/api/transcribe/file"
+        self._get_base_url()
+        return self._upload_url
     
     def _get_task_status_url(self, task_id: str) -> str:
         """获取任务状态API地址"""
-        base_url = self.config.server_url.rstrip('/')
-        return f"{base_url}/api/task/{task_id}"
+        self._get_base_url()
+        return self._task_status_fmt.format(task_id)
     
-    def auto_detect_server(self) -> Optional[str]:
-        """自动检测可用的本地服务器端口"""
-        print("🔍 自动检测本地服务器...")
+    def auto_detect_server(self, local_ports: Optional[Iterable[int]] = None) -> Optional[str]:
+        """
+        自动检测可用的本地服务器端口（并发探测各端口）
+        
+        Args:
+            local_ports: 候选端口，默认为LOCAL_PORTS
+        
+        Returns:
+            Optional[str]: 检测到的服务器地址，未找到时返回None
+        """
+        log.debug("🔍 自动检测本地服务器...")
         
-        # 常见的本地服务器端口列表
-        local_ports = [8000, 8001, 8002, 8003, 8888, 8889, 5000, 3000]
+        local_ports = list(self.LOCAL_PORTS if local_ports is None else local_ports)
         
+        # Linux上先查询系统监听端口表，只探测确实有服务在监听的端口
+        listening = _listening_ports()
+        if listening is not None:
+            local_ports = [port for port in local_ports if port in listening]
+        
+        if not local_ports:
+            print("❌ 未找到可用的本地服务器")
+            return None
+        
+        probes = {}
         for port in local_ports:
             test_url = f"http://localhost:{port}"
-            try:
-                health_urls = [
-                    f"{test_url}/health",
-                    f"{test_url}/api/health", 
-                    f"{test_url}/",
-                    f"{test_url}"
-                ]
-                
-                for url in health_urls:
-                    try:
-                        response = self.session.get(url, timeout=3)
-                        if response.status_code in [200, 404]:
-                            print(f"✅ 发现可用服务器: {test_url}")
-                            return test_url
-                    except requests.exceptions.RequestException:
-                        continue
-                        
-            except Exception:
-                continue
+            for url in (f"{test_url}/health", f"{test_url}/api/health", f"{test_url}/", test_url):
+                probes[url] = test_url
+        
+        # 本地服务器1秒内无响应即视为不可用；所有探测结束后按候选端口顺序选择，
+        # 避免响应更快的其他本地服务（如8888上的Jupyter）抢先被选中
+        available = set()
+        executor = ThreadPoolExecutor(max_workers=len(probes))
+        try:
+            futures = {executor.submit(self.session.get, url, timeout=1): base for url, base in probes.items()}
+            for future in as_completed(futures):
+                try:
+                    response = future.result()
+                except requests.exceptions.RequestException:
+                    continue
+                if response.status_code in [200, 404]:
+                    available.add(futures[future])
+        finally:
+            executor.shutdown(wait=False)
+        
+        for port in local_ports:
+            test_url = f"http://localhost:{port}"
+            if test_url in available:
+                print(f"✅ 发现可用服务器: {test_url}")
+                return test_url
                 
         print("❌ 未找到可用的本地服务器")
         return None
         
-    def test_connection(self) -> bool:
-        """测试服务器连接（支持自动端口检测）"""
+    def test_connection(self, use_cache: bool = False) -> bool:
+        """
+        测试服务器连接（支持自动端口检测）
+        
+        Args:
+            use_cache: 是否复用CONNECTION_CACHE_TTL秒内同一服务器的测试结果
+        """
+        server_url = self.config.server_url
+        now = time.monotonic()
+        if use_cache and self._conn_cache:
+            cached_url, tested_at, ok = self._conn_cache
+            if cached_url == server_url and now - tested_at < self.CONNECTION_CACHE_TTL:
+                return ok
+        
+        ok = self._probe_connection()
+        # 自动检测可能切换了服务器地址，按测试后的地址缓存
+        self._conn_cache = (self.config.server_url, now, ok)
+        return ok
+    
+    def _probe_connection(self) -> bool:
+        """实际发起请求测试服务器连接"""
         try:
-            print("🔍 测试服务器连接...")
+            log.debug("🔍 测试服务器连接...")
             
             # 首先尝试配置的服务器地址
-            base_url = self.config.server_url.rstrip('/')
+            base_url = self._get_base_url()
             health_urls = [
                 f"{base_url}/health",
                 f"{base_url}/api/health", 
@@ -112,7 +322,7 @@ class ServerUploader:
                 try:
                     response = self.session.get(url, timeout=10)
                     if response.status_code in [200, 404]:  # 404也说明服务器在线
-                        print(f"✅ 服务器连接正常: {response.status_code}")
+                        log.debug("✅ 服务器连接正常: %s", response.status_code)
                         return True
                 except requests.exceptions.RequestException:
                     continue
@@ -125,6 +335,7 @@ class ServerUploader:
                 if detected_url:
                     # 更新配置中的服务器地址
                     self.config.server_url = detected_url
+                    self._rebuild_urls()
                     print(f"🔄 已切换到检测到的服务器: {detected_url}")
                     return True
             
@@ -146,24 +357,22 @@ class ServerUploader:
         Returns:
             UploadResult: 上传结果
         """
-        file_path = Path(file_path)
-        if not file_path.exists():
+        # 一次stat同时完成存在性检查和获取文件大小
+        file_path = os.fspath(file_path)
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
             return UploadResult(
                 success=False,
                 error=f"文件不存在: {file_path}"
             )
         
-        file_size = file_path.stat().st_size
-        print(f"📤 开始上传: {file_path.name} ({file_size / 1024 / 1024:.1f}MB)")
+        file_name = os.path.basename(file_path)
+        print(f"📤 开始上传: {file_name} ({file_size / 1024 / 1024:.1f}MB)")
         
         try:
             upload_url = self._get_upload_url()
             
-            # 准备文件和表单数据
-            files = {
-                'file': (file_path.name, open(file_path, 'rb'), 'audio/mpeg')
-            }
-            
             # 转录参数
             data = {
                 'provider': kwargs.get('provider', 'openai'),
@@ -176,72 +385,93 @@ class ServerUploader:
             # 创建进度条
             progress_bar = None
             if self.config.show_progress:
+                from tqdm import tqdm
                 progress_bar = tqdm(
                     total=file_size,
                     unit='B',
                     unit_scale=True,
-                    desc="上传中"
+                    desc="上传中",
+                    mininterval=0.25,
+                    miniters=65536
                 )
             
-            # 自定义上传函数，支持进度显示
-            def upload_callback(monitor):
-                if progress_bar:
-                    progress_bar.update(monitor.bytes_read - progress_bar.n)
-                if self.progress_callback:
-                    percent = (monitor.bytes_read / file_size) * 100
-                    self.progress_callback({
-                        'status': 'uploading',
-                        'percent': percent,
-                        'uploaded': monitor.bytes_read,
-                        'total': file_size
-                    })
+            # 上次报告进度的时间；每次发送都会触发回调，最多每PROGRESS_INTERVAL秒处理一次
+            last_report = [0.0]
             
-            # 发送请求
-            print(f"🚀 上传到: {upload_url}")
-            
-            response = self.session.post(
-                upload_url,
-                files=files,
-                data=data,
-                timeout=self.config.timeout
-            )
+            # 每次回调复用同一个字典，回调函数不应保留该对象（需要时请复制）
+            progress_data = {'status': 'uploading', 'percent': 0.0, 'uploaded': 0, 'total': file_size}
             
-            # 关闭文件
-            files['file'][1].close()
+            # 上传进度回调（sent/total包含multipart头部，按请求体总长度计算百分比）
+            def report_progress(sent: int, total: int):
+                now = time.monotonic()
+                if sent < total and now - last_report[0] < self.PROGRESS_INTERVAL:
+                    return
+                last_report[0] = now
+                
+                if progress_bar:
+                    progress_bar.update(min(sent, file_size) - progress_bar.n)
+                if self.progress_callback:
+                    progress_data['percent'] = (sent / total) * 100
+                    progress_data['uploaded'] = sent
+                    progress_data['total'] = total
+                    self.progress_callback(progress_data)
             
-            if progress_bar:
-                progress_bar.close()
+            log.debug("🚀 上传到: %s", upload_url)
             
-            # 处理响应
-            if response.status_code == 200:
-                result_data = response.json()
-                task_id = result_data.get('task_id')
+            # 准备文件和表单数据（无论请求是否成功都会关闭文件）
+            with open(file_path, 'rb') as file_obj:
+                if self._can_sendfile(upload_url, file_size):
+                    try:
+                        status_code, body = self._upload_via_sendfile(
+                            upload_url, file_obj, file_name, file_size, data, report_progress
+                        )
+                    finally:
+                        if progress_bar:
+                            progress_bar.close()
+                    return self._handle_upload_response(status_code, body)
                 
-                print(f"✅ 上传成功!")
-                print(f"📋 任务ID: {task_id}")
+                compress = self._should_compress(file_obj, file_name)
                 
-                return UploadResult(
-                    success=True,
-                    task_id=task_id,
-                    message="文件上传并开始转录",
-                    server_response=result_data
-                )
-            else:
-                error_msg = f"HTTP {response.status_code}: {response.text}"
-                print(f"❌ 上传失败: {error_msg}")
+                if MultipartEncoder is not None:
+                    # 边读文件边发送，内存占用与文件大小无关
+                    encoder = MultipartEncoder(fields={
+                        **{key: str(value) for key, value in data.items()},
+                        'file': (file_name, file_obj, 'audio/mpeg'),
+                    })
+                    monitor = MultipartEncoderMonitor(encoder, lambda m: report_progress(m.bytes_read, m.len))
+                    headers = {'Content-Type': monitor.content_type}
+                    if compress:
+                        # 发送时边读边压缩整个请求体，进度仍按压缩前的字节数计算
+                        reader = zstandard.ZstdCompressor(level=1).stream_reader(monitor, size=monitor.len)
+                        body = iter(lambda: reader.read(self.COMPRESS_READ_SIZE), b'')
+                        headers['Content-Encoding'] = 'zstd'
+                        log.debug("🗜️ 使用zstd压缩上传")
+                        request_kwargs = {'data': body, 'headers': headers}
+                    else:
+                        request_kwargs = {'data': monitor, 'headers': headers}
+                else:
+                    # requests会先在内存中拼出完整的multipart请求体（无法显示上传进度）
+                    request_kwargs = {'files': {'file': (file_name, file_obj, 'audio/mpeg')}, 'data': data}
                 
-                return UploadResult(
-                    success=False,
-                    error=error_msg,
-                    server_response=response.text
-                )
+                # 发送请求
+                try:
+                    response = self.session.post(
+                        upload_url,
+                        timeout=self.config.timeout,
+                        **request_kwargs
+                    )
+                finally:
+                    if progress_bar:
+                        progress_bar.close()
+            
+            return self._handle_upload_response(response.status_code, response.content)
                 
-        except requests.exceptions.Timeout:
+        except (requests.exceptions.Timeout, socket.timeout):
             error_msg = "上传超时"
             print(f"❌ {error_msg}")
             return UploadResult(success=False, error=error_msg)
             
-        except requests.exceptions.ConnectionError:
+        except (requests.exceptions.ConnectionError, ConnectionError):
             error_msg = "无法连接到服务器"
             print(f"❌ {error_msg}")
             return UploadResult(success=False, error=error_msg)
@@ -251,14 +481,159 @@ class ServerUploader:
             print(f"❌ {error_msg}")
             return UploadResult(success=False, error=error_msg)
     
+    def _should_compress(self, file_obj, file_name: str) -> bool:
+        """判断是否以zstd压缩上传：仅限启用compress_upload时的WAV/AIFF音频"""
+        if not self.config.compress_upload or zstandard is None or MultipartEncoder is None:
+            return False
+        if not file_name.lower().endswith(self.COMPRESSIBLE_SUFFIXES):
+            return False
+        
+        # 按文件头确认格式，避免扩展名与内容不符
+        header = file_obj.read(12)
+        file_obj.seek(0)
+        return header[8:12] in (b'WAVE', b'AIFF') and header[:4] in (b'RIFF', b'FORM')
+    
+    def _handle_upload_response(self, status_code: int, body: bytes) -> UploadResult:
+        """解析上传接口的响应"""
+        if status_code == 200:
+            result_data = _json_loads(body)
+            task_id = result_data.get('task_id')
+            
+            print(f"✅ 上传成功!")
+            print(f"📋 任务ID: {task_id}")
+            
+            return UploadResult(
+                success=True,
+                task_id=task_id,
+                message="文件上传并开始转录",
+                server_response=result_data
+            )
+        else:
+            text = body.decode('utf-8', errors='replace')
+            error_msg = f"HTTP {status_code}: {text}"
+            print(f"❌ 上传失败: {error_msg}")
+            
+            return UploadResult(
+                success=False,
+                error=error_msg,
+                server_response=text
+            )
+    
+    def _can_sendfile(self, upload_url: str, file_size: int) -> bool:
+        """是否可以使用sendfile快速路径（仅限本机明文HTTP和大文件）"""
+        if not hasattr(os, 'sendfile') or file_size < self.SENDFILE_MIN_SIZE:
+            return False
+        parsed = urlparse(upload_url)
+        # HTTPS需要在用户态加密，sendfile无法带来零拷贝
+        return parsed.scheme == 'http' and parsed.hostname in ('localhost', '127.0.0.1', '::1')
+    
+    def _upload_via_sendfile(self, upload_url: str, file_obj, filename: str, file_size: int,
+                             fields: Dict[str, Any], report_progress: Callable) -> Tuple[int, bytes]:
+        """
+        手动构造multipart请求，并用sendfile发送文件内容（内核直接从页缓存复制到套接字）
+        
+        Returns:
+            Tuple[int, bytes]: (HTTP状态码, 响应体)
+        """
+        boundary = uuid.uuid4().hex
+        safe_name = filename.replace('"', '%22')
+        parts = [
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+            for name, value in fields.items()
+        ]
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{safe_name}"\r\n'
+            f'Content-Type: audio/mpeg\r\n\r\n'
+        )
+        preamble = ''.join(parts).encode('utf-8')
+        epilogue = f'\r\n--{boundary}--\r\n'.encode('ascii')
+        total = len(preamble) + file_size + len(epilogue)
+        
+        parsed = urlparse(upload_url)
+        conn = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=self.config.timeout)
+        try:
+            path = parsed.path + (f'?{parsed.query}' if parsed.query else '')
+            conn.putrequest('POST', path, skip_accept_encoding=True)
+            # http.client不会解码压缩的响应体，要求服务器返回未压缩的响应
+            for name, value in self.session.headers.items():
+                if name.lower() != 'accept-encoding':
+                    conn.putheader(name, value)
+            conn.putheader('Accept-Encoding', 'identity')
+            conn.putheader('Content-Type', f'multipart/form-data; boundary={boundary}')
+            conn.putheader('Content-Length', str(total))
+            conn.endheaders()
+            
+            conn.send(preamble)
+            sent = len(preamble)
+            offset = 0
+            while offset < file_size:
+                # socket.sendfile内部使用os.sendfile，并正确处理套接字超时
+                count = conn.sock.sendfile(file_obj, offset, min(self.SENDFILE_CHUNK, file_size - offset))
+                if count == 0:
+                    raise ConnectionError("sendfile未发送任何数据")
+                offset += count
+                sent += count
+                report_progress(sent, total)
+            conn.send(epilogue)
+            report_progress(total, total)
+            
+            response = conn.getresponse()
+            return response.status, response.read()
+        finally:
+            conn.close()
+    
+    async def upload_file_async(self, file_path: str, **kwargs) -> UploadResult:
+        """在事件循环中上传文件（请求在线程池中执行，不阻塞事件循环）"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: self.upload_file(file_path, **kwargs))
+    
+    async def upload_files_async(self, file_paths: List[str], concurrency: int = 4,
+                                 **kwargs) -> List[UploadResult]:
+        """
+        并发上传多个文件
+        
+        Args:
+            file_paths: 文件路径列表
+            concurrency: 同时进行的最大上传数
+            **kwargs: 其他转录参数
+        
+        Returns:
+            List[UploadResult]: 与file_paths顺序一致的上传结果
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def upload_one(path: str) -> UploadResult:
+            async with semaphore:
+                return await self.upload_file_async(path, **kwargs)
+        
+        return list(await asyncio.gather(*(upload_one(path) for path in file_paths)))
+    
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """获取任务状态"""
         try:
             status_url = self._get_task_status_url(task_id)
-            response = self.session.get(status_url, timeout=30)
             
-            if response.status_code == 200:
-                return response.json()
+            # 带上次的ETag发起条件请求，状态未变化时服务器返回304且无响应体
+            headers = {}
+            etag = self._etag_cache.get(task_id)
+            if etag and task_id in self._status_cache:
+                headers['If-None-Match'] = etag
+            
+            response = self.session.get(status_url, headers=headers, timeout=30)
+            
+            if response.status_code == 304 and task_id in self._status_cache:
+                return self._status_cache[task_id]
+            elif response.status_code == 200:
+                status_data = _json_loads(response.content)
+                etag = response.headers.get('ETag')
+                if status_data.get('status') in ('completed', 'failed'):
+                    # 任务已结束，不会再轮询，释放缓存（完成的状态可能包含完整转录文本）
+                    self._etag_cache.pop(task_id, None)
+                    self._status_cache.pop(task_id, None)
+                elif etag:
+                    self._etag_cache[task_id] = etag
+                    self._status_cache[task_id] = status_data
+                return status_data
             else:
                 return {
                     'error': f'HTTP {response.status_code}: {response.text}'
@@ -269,24 +644,42 @@ class ServerUploader:
                 'error': f'获取任务状态异常: {str(e)}'
             }
     
+    def get_task_status_raw(self, task_id: str) -> bytes:
+        """获取任务状态的原始JSON响应体（不经解析，失败时抛出异常）"""
+        response = self.session.get(self._get_task_status_url(task_id), timeout=30)
+        response.raise_for_status()
+        return response.content
+    
+    def _next_poll_delay(self, delay: float, poll_interval: float, changed: bool) -> float:
+        """计算下次轮询间隔（自适应退避）"""
+        if changed:
+            return poll_interval
+        return min(delay * self.POLL_BACKOFF, self.MAX_POLL_INTERVAL)
+    
     def wait_for_completion(self, task_id: str, 
-                          poll_interval: int = 5, 
-                          max_wait_time: int = 600) -> Dict[str, Any]:
+                          poll_interval: float = 1.0, 
+                          max_wait_time: int = 600,
+                          stop_event: Optional[threading.Event] = None) -> Dict[str, Any]:
         """
         等待任务完成
         
         Args:
             task_id: 任务ID
-            poll_interval: 轮询间隔（秒）
+            poll_interval: 初始轮询间隔（秒），状态不变时逐渐增大到MAX_POLL_INTERVAL
             max_wait_time: 最大等待时间（秒）
+            stop_event: 设置后立即停止等待（用于中断操作）
         
         Returns:
             Dict: 最终任务状态
         """
         print(f"⏳ 等待转录完成 (任务ID: {task_id})")
         
+        from tqdm import tqdm
+        
         start_time = time.time()
         last_status = None
+        last_state = None
+        delay = poll_interval
         
         with tqdm(desc="转录中", unit="s") as pbar:
             while time.time() - start_time < max_wait_time:
@@ -317,9 +710,18 @@ class ServerUploader:
                     print(f"\n❌ 转录失败: {error_msg}")
                     return status_data
                 
-                # 等待下次轮询
-                time.sleep(poll_interval)
-                pbar.update(poll_interval)
+                # 等待下次轮询（状态或进度变化时立即恢复到初始间隔）
+                state = (current_status, progress)
+                delay = self._next_poll_delay(delay, poll_interval, state != last_state)
+                last_state = state
+                
+                wait = min(delay, max(0.0, max_wait_time - (time.time() - start_time)))
+                if stop_event is not None:
+                    if stop_event.wait(wait):
+                        return {'error': '等待已取消', 'task_id': task_id, 'cancelled': True}
+                else:
+                    time.sleep(wait)
+                pbar.update(wait)
         
         # 超时
         print(f"\n⏰ 等待超时 ({max_wait_time}秒)")
@@ -329,24 +731,85 @@ class ServerUploader:
             'timeout': True
         }
     
+    async def wait_for_completion_async(self, task_id: str,
+                                        poll_interval: float = 1.0,
+                                        max_wait_time: int = 600) -> Dict[str, Any]:
+        """
+        在事件循环中等待任务完成（轮询间隔以协程挂起，不占用线程）
+        
+        Args:
+            task_id: 任务ID
+            poll_interval: 初始轮询间隔（秒），状态不变时逐渐增大到MAX_POLL_INTERVAL
+            max_wait_time: 最大等待时间（秒）
+        
+        Returns:
+            Dict: 最终任务状态
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait_time
+        last_state = None
+        delay = poll_interval
+        
+        while loop.time() < deadline:
+            # 仅状态请求本身在线程池中执行
+            status_data = await loop.run_in_executor(None, self.get_task_status, task_id)
+            
+            if 'error' in status_data:
+                return status_data
+            if status_data.get('status') in ('completed', 'failed'):
+                return status_data
+            
+            state = (status_data.get('status'), status_data.get('progress', 0))
+            delay = self._next_poll_delay(delay, poll_interval, state != last_state)
+            last_state = state
+            await asyncio.sleep(min(delay, max(0.0, deadline - loop.time())))
+        
+        return {
+            'error': f'等待超时，任务可能仍在进行中。任务ID: {task_id}',
+            'task_id': task_id,
+            'timeout': True
+        }
+    
+    def _download_stream(self, url: str, dst: Path, chunk_size: int = 1 << 20):
+        """流式下载文件到磁盘，内存占用与文件大小无关（不解析响应内容）"""
+        tmp_path = dst.with_name(dst.name + '.part')
+        try:
+            with self.session.get(url, stream=True, timeout=self.config.timeout) as response:
+                response.raise_for_status()
+                # 直接复制原始响应流，由urllib3负责解压gzip等传输编码
+                response.raw.decode_content = True
+                with open(tmp_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=chunk_size)
+            os.replace(tmp_path, dst)
+        except BaseException:
+            # 下载失败时删除未完成的临时文件
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
     def download_result(self, task_id: str, output_dir: str = "./results") -> Optional[str]:
         """下载转录结果"""
         try:
-            # 获取任务状态，包含结果链接
-            status_data = self.get_task_status(task_id)
+            # 获取任务状态，包含结果链接（保留原始响应体，保存时无需重新序列化）
+            raw_status = self.get_task_status_raw(task_id)
+            status_data = _json_loads(raw_status)
             
             if status_data.get('status') != 'completed':
                 print("❌ 任务尚未完成，无法下载结果")
                 return None
             
-            # 这里需要根据服务器API实现下载逻辑
-            # 目前先返回状态信息
             output_path = Path(output_dir)
             output_path.mkdir(exist_ok=True, parents=True)
             
-            result_file = output_path / f"transcription_{task_id}.json"
-            with open(result_file, 'w', encoding='utf-8') as f:
-                json.dump(status_data, f, indent=2, ensure_ascii=False)
+            # 服务器提供结果链接时流式下载结果文件，否则保存状态信息
+            result_url = status_data.get('result_url') or status_data.get('download_url')
+            if result_url:
+                result_url = urljoin(self._get_base_url() + '/', result_url)
+                suffix = Path(urlparse(result_url).path).suffix or '.json'
+                result_file = output_path / f"transcription_{task_id}{suffix}"
+                self._download_stream(result_url, result_file)
+            else:
+                result_file = output_path / f"transcription_{task_id}.json"
+                result_file.write_bytes(raw_status)
             
             print(f"✅ 转录结果已保存: {result_file}")
             return str(result_file)